@@ -24,7 +24,7 @@ export type { MazeData, MazeResult };
 let pyodide: PyodideInterface | null = null;
 let pyodideInitPromise: Promise<PyodideInterface> | null = null;
 
-const WHEEL_URL = "/py_ant_maze-0.1.1-py3-none-any.whl";
+const WHEEL_URL = "/py_ant_maze-0.1.2-py3-none-any.whl";
 
 /**
  * Initialize and return the Pyodide instance.
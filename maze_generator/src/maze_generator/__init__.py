@@ -2,22 +2,21 @@
 
 from __future__ import annotations
 
+import os
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from py_ant_maze import Maze
 
+from ._lazy import lazy_module_attributes
 from .export_options import ExportOptions
 from .maze_geometry.extractor import extract_geometry
+from .maze_geometry.models import MazeGeometry
 from .maze_materials.color import MaterialMap
-from .maze_materials.discovery import (
-    discover_all_default_materials,
-    discover_default_materials,
-    get_default_assets_path,
-)
 from .maze_materials.source import MaterialSource, UsdMaterialRef
-from .maze_obj.writer import write_obj_bundle
-from .maze_usd.writer import write_usd
 
 __all__ = [
     "ExportOptions",
@@ -30,6 +29,15 @@ __all__ = [
     "maze_to_usd",
 ]
 
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(),
+    {
+        "discover_all_default_materials": ".maze_materials.discovery",
+        "discover_default_materials": ".maze_materials.discovery",
+        "get_default_assets_path": ".maze_materials.discovery",
+    },
+)
+
 
 def maze_to_usd(
     maze_or_path: Maze | str | Path,
@@ -39,17 +47,20 @@ def maze_to_usd(
     material_map: MaterialMap | None = None,
     material_source: MaterialSource | None = None,
 ) -> str:
+    from .maze_usd.writer import write_usd
+
     maze = _coerce_maze(maze_or_path)
     resolved_export_options = _resolve_export_options(export_options)
     resolved_material_source = _resolve_material_source(material_source)
 
-    geometry = extract_geometry(maze)
-    geometry = resolved_export_options.apply_to_geometry(geometry)
+    geometry = _prepared_geometry(maze, resolved_export_options)
     write_usd(
         geometry,
         output_path,
         material_map=material_map,
         material_source=resolved_material_source,
+        union_workers=resolved_export_options.union_workers,
+        half_precision_uvs=resolved_export_options.half_precision_uvs,
     )
     return str(Path(output_path).resolve())
 
@@ -62,17 +73,20 @@ def maze_to_obj(
     material_map: MaterialMap | None = None,
     material_source: MaterialSource | None = None,
 ) -> str:
+    from .maze_obj.writer import write_obj_bundle
+
     maze = _coerce_maze(maze_or_path)
     resolved_export_options = _resolve_export_options(export_options)
     resolved_material_source = _resolve_material_source(material_source)
 
-    geometry = extract_geometry(maze)
-    geometry = resolved_export_options.apply_to_geometry(geometry)
+    geometry = _prepared_geometry(maze, resolved_export_options)
     write_obj_bundle(
         geometry,
         output_dir,
         material_map=material_map,
         material_source=resolved_material_source,
+        link_textures=resolved_export_options.link_textures,
+        union_workers=resolved_export_options.union_workers,
     )
     return str(Path(output_dir).resolve())
 
@@ -84,18 +98,89 @@ def _coerce_maze(maze_or_path: Any):
         maze_path = Path(maze_or_path)
         if not maze_path.is_file():
             raise FileNotFoundError(f"Maze file not found: {maze_path}")
-        return Maze.from_file(str(maze_path))
+        return Maze.from_file(maze_path)
     raise TypeError("maze_or_path must be a py_ant_maze.Maze instance or a path")
 
 
+_GEOMETRY_CACHE_SIZE = 4
+_geometry_cache: OrderedDict[int, tuple[weakref.ref, MazeGeometry, dict[tuple[str, bool], MazeGeometry]]] = (
+    OrderedDict()
+)
+
+
+def _prepared_geometry(maze: Maze, export_options: ExportOptions) -> MazeGeometry:
+    _, extracted, prepared = _geometry_cache_entry(maze)
+    key = (export_options.target_frame, export_options.merge_walls)
+    geometry = prepared.get(key)
+    if geometry is None:
+        geometry = export_options.apply_to_geometry(extracted)
+        prepared[key] = geometry
+    return geometry
+
+
+def _geometry_cache_entry(
+    maze: Maze,
+) -> tuple[weakref.ref, MazeGeometry, dict[tuple[str, bool], MazeGeometry]]:
+    key = id(maze)
+    entry = _geometry_cache.get(key)
+    if entry is not None and entry[0]() is maze:
+        _geometry_cache.move_to_end(key)
+        return entry
+    geometry = extract_geometry(maze)
+    maze_ref = weakref.ref(maze, lambda ref, key=key: _drop_geometry_cache_entry(key, ref))
+    entry = (maze_ref, geometry, {})
+    _geometry_cache[key] = entry
+    _geometry_cache.move_to_end(key)
+    while len(_geometry_cache) > _GEOMETRY_CACHE_SIZE:
+        _geometry_cache.popitem(last=False)
+    return entry
+
+
+def _drop_geometry_cache_entry(key: int, maze_ref: weakref.ref) -> None:
+    entry = _geometry_cache.get(key)
+    if entry is not None and entry[0] is maze_ref:
+        del _geometry_cache[key]
+
+
 def _resolve_material_source(material_source: MaterialSource | None) -> MaterialSource:
     if material_source is not None and not isinstance(material_source, MaterialSource):
         raise TypeError("material_source must be MaterialSource")
     if material_source is None:
-        return discover_default_materials(allow_empty=True)
+        from .maze_materials.discovery import get_default_assets_path
+
+        assets_path = get_default_assets_path()
+        return _default_materials_cached(
+            _asset_tree_signature(assets_path / "textures"),
+            _asset_tree_signature(assets_path / "materials"),
+        )
     return material_source
 
 
+@lru_cache(maxsize=1)
+def _default_materials_cached(
+    textures_signature: tuple[tuple[str, int, int], ...],
+    materials_signature: tuple[tuple[str, int, int], ...],
+) -> MaterialSource:
+    from .maze_materials.discovery import discover_default_materials
+
+    return discover_default_materials(allow_empty=True)
+
+
+def _asset_tree_signature(directory: Path) -> tuple[tuple[str, int, int], ...]:
+    """Path, mtime and size of every file under `directory`, in a stable order."""
+    signature = []
+    for root, dir_names, file_names in os.walk(directory):
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            path = os.path.join(root, file_name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
 def _resolve_export_options(export_options: ExportOptions | None) -> ExportOptions:
     if export_options is None:
         return ExportOptions()
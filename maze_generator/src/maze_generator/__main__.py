@@ -3,15 +3,36 @@
 from __future__ import annotations
 
 import argparse
-from pathlib import Path
-
-from . import ExportOptions, maze_to_obj, maze_to_usd
+import os
 
 _USD_SUFFIXES = {".usd", ".usda", ".usdc", ".usdz"}
 _OBJ_NAME_HINTS = ("_obj", "_obj_bundle")
 
 
 def main() -> None:
+    args = _parse_args()
+
+    from . import ExportOptions, maze_to_obj, maze_to_usd
+
+    output_format = _resolve_format(args.format, args.output)
+    output = _resolve_output_path(args.input, args.output, output_format)
+    export_options = ExportOptions(
+        target_frame=args.frame,
+        merge_walls=args.merge_walls,
+        union_workers=args.union_workers or None,
+        link_textures=args.link_textures,
+        half_precision_uvs=args.half_precision_uvs,
+    )
+
+    if output_format == "usd":
+        written_path = maze_to_usd(args.input, output, export_options=export_options)
+    else:
+        written_path = maze_to_obj(args.input, output, export_options=export_options)
+
+    print(f"Wrote {written_path}")
+
+
+def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="maze-generator",
         description="Generate maze geometry files (USD or OBJ) from a py-ant-maze YAML configuration.",
@@ -44,31 +65,49 @@ def main() -> None:
             "'config' preserves original layout indexing."
         ),
     )
-    args = parser.parse_args()
-
-    output_format = _resolve_format(args.format, args.output)
-    output = _resolve_output_path(args.input, args.output, output_format)
-    export_options = ExportOptions(target_frame=args.frame)
+    parser.add_argument(
+        "--merge-walls",
+        action="store_true",
+        help="Coalesce adjacent wall boxes of the same element into larger boxes before export.",
+    )
+    parser.add_argument(
+        "--link-textures",
+        action="store_true",
+        help="OBJ only: hard-link textures into the bundle instead of copying them.",
+    )
+    parser.add_argument(
+        "--half-precision-uvs",
+        action="store_true",
+        help="USD only: author wall texture coordinates as half floats (texCoord2h[]).",
+    )
+    parser.add_argument(
+        "--union-workers",
+        type=_non_negative_int,
+        default=1,
+        metavar="N",
+        help="Processes used for the per-element boolean union (default: 1; 0 uses one per CPU).",
+    )
+    return parser.parse_args()
 
-    if output_format == "usd":
-        written_path = maze_to_usd(args.input, output, export_options=export_options)
-    else:
-        written_path = maze_to_obj(args.input, output, export_options=export_options)
 
-    print(f"Wrote {written_path}")
+def _non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("must be >= 0")
+    return number
 
 
 def _resolve_format(format_arg: str | None, output_arg: str | None) -> str:
     if format_arg is not None:
         return format_arg
     if output_arg is not None:
-        output_path = Path(output_arg)
-        suffix = output_path.suffix.lower()
+        output_path = os.path.normpath(output_arg)
+        suffix = os.path.splitext(output_path)[1].lower()
         if suffix == ".obj":
             return "obj"
         if suffix in _USD_SUFFIXES:
             return "usd"
-        if not suffix and output_path.name.lower().endswith(_OBJ_NAME_HINTS):
+        if not suffix and os.path.basename(output_path).lower().endswith(_OBJ_NAME_HINTS):
             return "obj"
     return "usd"
 
@@ -83,24 +122,23 @@ def _normalize_output_path(output_path: str, output_format: str) -> str:
     if output_format != "usd":
         return output_path
 
-    output = Path(output_path)
-    suffix = output.suffix.lower()
-    if suffix in _USD_SUFFIXES:
+    root, suffix = os.path.splitext(output_path)
+    if suffix.lower() in _USD_SUFFIXES:
         return output_path
     if suffix:
-        return str(output.with_suffix(".usda"))
+        return f"{root}.usda"
     return f"{output_path}.usda"
 
 
 def _default_output_path(input_path: str, output_format: str) -> str:
-    path = Path(input_path)
+    root, suffix = os.path.splitext(input_path)
     if output_format == "usd":
-        if path.suffix:
-            return str(path.with_suffix(".usda"))
+        if suffix:
+            return f"{root}.usda"
         return f"{input_path}.usda"
 
-    if path.suffix:
-        return f"{path.with_suffix('')}_obj"
+    if suffix:
+        return f"{root}_obj"
     return f"{input_path}_obj"
 
 
@@ -0,0 +1,27 @@
+"""Module-level lazy attribute loading (PEP 562)."""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable, Mapping
+
+
+def lazy_module_attributes(
+    module_globals: dict[str, Any],
+    attributes: Mapping[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build `__getattr__`/`__dir__` that import each name from its module on first access."""
+    package = module_globals["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(module_globals) | set(module_globals.get("__all__", ())))
+
+    return __getattr__, __dir__
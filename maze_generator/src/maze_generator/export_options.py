@@ -4,20 +4,54 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from .maze_geometry.models import CoordinateFrame, MazeGeometry, normalize_coordinate_frame
+from .maze_geometry.models import CoordinateFrame, MazeGeometry, WallBox, normalize_coordinate_frame
 
 
 @dataclass(frozen=True, slots=True)
 class ExportOptions:
-    """Export-time controls applied to extracted geometry."""
+    """Export-time controls applied to extracted geometry and the output writers."""
 
     target_frame: CoordinateFrame = "simulation_genesis"
+    merge_walls: bool = False
+    union_workers: int | None = 1
+    link_textures: bool = False
+    half_precision_uvs: bool = False
 
     def __post_init__(self) -> None:
         normalized = normalize_coordinate_frame(self.target_frame)
         object.__setattr__(self, "target_frame", normalized)
+        if not isinstance(self.merge_walls, bool):
+            raise TypeError("merge_walls must be a bool")
+        if not isinstance(self.link_textures, bool):
+            raise TypeError("link_textures must be a bool")
+        if not isinstance(self.half_precision_uvs, bool):
+            raise TypeError("half_precision_uvs must be a bool")
+        if self.union_workers is not None:
+            if isinstance(self.union_workers, bool) or not isinstance(self.union_workers, int):
+                raise TypeError("union_workers must be an int or None")
+            if self.union_workers < 1:
+                raise ValueError("union_workers must be >= 1")
 
     def apply_to_geometry(self, geometry: MazeGeometry) -> MazeGeometry:
         if not isinstance(geometry, MazeGeometry):
             raise TypeError("geometry must be MazeGeometry")
-        return geometry.to_frame(self.target_frame)
+        geometry = geometry.to_frame(self.target_frame)
+        if self.merge_walls:
+            geometry = _merge_walls(geometry)
+        return geometry
+
+
+def _merge_walls(geometry: MazeGeometry) -> MazeGeometry:
+    """Coalesce touching boxes of the same element into maximal rectangles."""
+    from .maze_boolean.union import convex_segment_boxes
+
+    grouped: dict[str, list[tuple[tuple[float, float, float], tuple[float, float, float]]]] = {}
+    for wall in geometry.walls:
+        grouped.setdefault(wall.element_name, []).append((wall.center, wall.size))
+
+    walls = [
+        WallBox(center=center, size=size, element_name=element_name)
+        for element_name, box_specs in sorted(grouped.items())
+        for center, size in convex_segment_boxes(box_specs)
+    ]
+    return MazeGeometry(tuple(walls), geometry.bounds, frame=geometry.frame)
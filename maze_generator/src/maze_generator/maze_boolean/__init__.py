@@ -1,5 +1,17 @@
 """Boolean operations package."""
 
-from .union import boolean_union_boxes, convex_segment_boxes, create_box_trimesh, trimesh_to_usd_data
+from .union import (
+    boolean_union_box_groups,
+    boolean_union_boxes,
+    convex_segment_boxes,
+    create_box_trimesh,
+    trimesh_to_usd_data,
+)
 
-__all__ = ["create_box_trimesh", "boolean_union_boxes", "convex_segment_boxes", "trimesh_to_usd_data"]
+__all__ = [
+    "create_box_trimesh",
+    "boolean_union_boxes",
+    "boolean_union_box_groups",
+    "convex_segment_boxes",
+    "trimesh_to_usd_data",
+]
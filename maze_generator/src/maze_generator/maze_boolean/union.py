@@ -3,81 +3,227 @@
 from __future__ import annotations
 
 import importlib.util
-from typing import Iterable, Literal, Sequence, cast
+from typing import TYPE_CHECKING, Iterable, Literal, Sequence, cast
 
 import numpy as np
-import trimesh
-from pxr import Gf
 
 from ..maze_geometry.models import Vec3
 
+if TYPE_CHECKING:
+    from pxr import Vt
+
 BoxSpec = tuple[Vec3, Vec3]
 UvMode = Literal["repeat", "stretch"]
 FaceSide = Literal["left", "right"]
 
+_UV_AXES_BY_DOMINANT_AXIS = np.array([[1, 2], [0, 2], [0, 1]], dtype=np.int64)
+
+_BOX_VERTEX_TEMPLATE = np.array(
+    [
+        [-0.5, -0.5, -0.5],
+        [-0.5, -0.5, 0.5],
+        [-0.5, 0.5, -0.5],
+        [-0.5, 0.5, 0.5],
+        [0.5, -0.5, -0.5],
+        [0.5, -0.5, 0.5],
+        [0.5, 0.5, -0.5],
+        [0.5, 0.5, 0.5],
+    ],
+    dtype=np.float64,
+)
+_BOX_FACE_TEMPLATE = np.array(
+    [
+        [1, 3, 0],
+        [4, 1, 0],
+        [0, 3, 2],
+        [2, 4, 0],
+        [1, 7, 3],
+        [5, 1, 4],
+        [5, 7, 1],
+        [3, 7, 2],
+        [6, 4, 2],
+        [2, 7, 6],
+        [6, 5, 4],
+        [7, 5, 6],
+    ],
+    dtype=np.int64,
+)
+
 
 def create_box_trimesh(center: Vec3, size: Vec3):
-    box = trimesh.creation.box(extents=size)
-    box.apply_translation(center)
-    return box
+    return _box_trimeshes([(center, size)])[0]
 
 
 def boolean_union_boxes(boxes: Iterable[BoxSpec]):
+    import trimesh
+
     _require_manifold3d()
     box_list = list(boxes)
     if not box_list:
         raise ValueError("boolean_union_boxes requires at least one box")
 
-    meshes = [create_box_trimesh(center, size) for center, size in box_list]
+    meshes = _box_trimeshes(box_list)
     if len(meshes) == 1:
         return meshes[0]
 
+    clusters = _touching_box_clusters(box_list)
+    cluster_count = int(clusters.max()) + 1
+    if cluster_count == 1:
+        return _manifold_union(meshes)
+
+    parts = []
+    for cluster in range(cluster_count):
+        members = np.flatnonzero(clusters == cluster).tolist()
+        if len(members) == 1:
+            parts.append(meshes[members[0]])
+        else:
+            parts.append(_manifold_union([meshes[member] for member in members]))
+
+    vertex_offsets = np.cumsum([0, *(len(part.vertices) for part in parts[:-1])])
+    return trimesh.Trimesh(
+        vertices=np.concatenate([part.vertices for part in parts]),
+        faces=np.concatenate([part.faces + offset for part, offset in zip(parts, vertex_offsets)]),
+        process=False,
+    )
+
+
+def _manifold_union(meshes: list):
+    import trimesh
+
     merged = trimesh.boolean.union(meshes, engine="manifold")
     if merged is None:
         raise RuntimeError("trimesh boolean union returned no mesh (engine='manifold')")
     return merged
 
 
+def _touching_box_clusters(box_list: Sequence[BoxSpec], *, decimals: int = 9) -> np.ndarray:
+    """Label boxes by connected cluster, where boxes that overlap or share a face are linked.
+
+    Candidate pairs are boxes that share a cell of a uniform grid sized to the mean box extent.
+    """
+    centers = np.array([center for center, _ in box_list], dtype=np.float64).reshape(-1, 3)
+    half_sizes = np.array([size for _, size in box_list], dtype=np.float64).reshape(-1, 3) / 2.0
+    mins = _quantize(centers - half_sizes, decimals=decimals)
+    maxs = _quantize(centers + half_sizes, decimals=decimals)
+
+    cell_size = np.maximum((maxs - mins).mean(axis=0), np.finfo(np.float64).tiny)
+    origin = mins.min(axis=0)
+    low_cells = np.floor((mins - origin) / cell_size).astype(np.int64)
+    high_cells = np.floor((maxs - origin) / cell_size).astype(np.int64)
+    spans = high_cells - low_cells + 1
+    cells_per_box = spans.prod(axis=1)
+
+    entry_boxes = np.repeat(np.arange(len(box_list)), cells_per_box)
+    local = np.arange(int(cells_per_box.sum())) - np.repeat(np.cumsum(cells_per_box) - cells_per_box, cells_per_box)
+    entry_spans = spans[entry_boxes]
+    entry_cells = low_cells[entry_boxes] + np.stack(
+        (
+            local % entry_spans[:, 0],
+            local // entry_spans[:, 0] % entry_spans[:, 1],
+            local // (entry_spans[:, 0] * entry_spans[:, 1]),
+        ),
+        axis=1,
+    )
+
+    order = np.lexsort(entry_cells.T[::-1])
+    sorted_cells = entry_cells[order]
+    sorted_boxes = entry_boxes[order]
+    run_starts = np.flatnonzero(np.r_[True, np.any(sorted_cells[1:] != sorted_cells[:-1], axis=1)])
+    run_ends = np.repeat(np.r_[run_starts[1:], len(order)], np.diff(np.r_[run_starts, len(order)]))
+    first = np.arange(len(order))
+    counts = run_ends - first - 1
+    left = np.repeat(first, counts)
+    right = left + 1 + np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+    box_a = sorted_boxes[left]
+    box_b = sorted_boxes[right]
+    touching = np.all((mins[box_b] <= maxs[box_a]) & (mins[box_a] <= maxs[box_b]), axis=1)
+    edges = np.stack((box_a[touching], box_b[touching]), axis=1)
+    return _connected_components(len(box_list), edges)
+
+
+def boolean_union_box_groups(
+    groups: Iterable[Iterable[BoxSpec]],
+    *,
+    max_workers: int | None = 1,
+) -> list:
+    """Union each box group independently, optionally across worker processes.
+
+    ``max_workers=1`` runs in-process; any other value (``None`` for the CPU count)
+    unions the groups in a process pool, since Manifold holds the GIL.
+    """
+    group_lists = [list(boxes) for boxes in groups]
+    if max_workers == 1 or len(group_lists) < 2:
+        return [boolean_union_boxes(boxes) for boxes in group_lists]
+
+    import trimesh
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        buffers = list(executor.map(_union_box_buffers, group_lists))
+    return [
+        trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+        for vertices, faces in buffers
+    ]
+
+
+def _union_box_buffers(box_list: list[BoxSpec]) -> tuple[np.ndarray, np.ndarray]:
+    mesh = boolean_union_boxes(box_list)
+    return np.asarray(mesh.vertices), np.asarray(mesh.faces)
+
+
+def _box_trimeshes(box_list: Sequence[BoxSpec]) -> list:
+    import trimesh
+
+    centers = np.array([center for center, _ in box_list], dtype=np.float64).reshape(-1, 3)
+    sizes = np.array([size for _, size in box_list], dtype=np.float64).reshape(-1, 3)
+    vertices = _BOX_VERTEX_TEMPLATE[None, :, :] * sizes[:, None, :] + centers[:, None, :]
+    return [
+        trimesh.Trimesh(vertices=box_vertices, faces=_BOX_FACE_TEMPLATE, process=False)
+        for box_vertices in vertices
+    ]
+
+
 def convex_segment_boxes(boxes: Iterable[BoxSpec], *, decimals: int = 9) -> list[BoxSpec]:
     """Cover the union of axis-aligned boxes with non-overlapping convex box segments."""
     box_list = list(boxes)
     if not box_list:
         raise ValueError("convex_segment_boxes requires at least one box")
 
-    bounds = [_box_bounds(center, size, decimals=decimals) for center, size in box_list]
-    x_breaks = sorted({x for mins, maxs in bounds for x in (mins[0], maxs[0])})
-    y_breaks = sorted({y for mins, maxs in bounds for y in (mins[1], maxs[1])})
-    z_breaks = sorted({z for mins, maxs in bounds for z in (mins[2], maxs[2])})
-
-    x_index = {value: index for index, value in enumerate(x_breaks)}
-    y_index = {value: index for index, value in enumerate(y_breaks)}
-    z_index = {value: index for index, value in enumerate(z_breaks)}
+    centers = np.array([center for center, _ in box_list], dtype=np.float64).reshape(-1, 3)
+    half_sizes = np.array([size for _, size in box_list], dtype=np.float64).reshape(-1, 3) / 2.0
+    mins_array = _quantize(centers - half_sizes, decimals=decimals)
+    maxs_array = _quantize(centers + half_sizes, decimals=decimals)
+    breaks_by_axis = [
+        np.unique(np.concatenate((mins_array[:, axis], maxs_array[:, axis]))) for axis in range(3)
+    ]
+    start_indices = [
+        np.searchsorted(breaks, mins_array[:, axis]).tolist() for axis, breaks in enumerate(breaks_by_axis)
+    ]
+    stop_indices = [
+        np.searchsorted(breaks, maxs_array[:, axis]).tolist() for axis, breaks in enumerate(breaks_by_axis)
+    ]
+    x_breaks, y_breaks, z_breaks = (breaks.tolist() for breaks in breaks_by_axis)
 
     occupied = np.zeros((len(x_breaks) - 1, len(y_breaks) - 1, len(z_breaks) - 1), dtype=bool)
-    for mins, maxs in bounds:
-        x0, x1 = x_index[mins[0]], x_index[maxs[0]]
-        y0, y1 = y_index[mins[1]], y_index[maxs[1]]
-        z0, z1 = z_index[mins[2]], z_index[maxs[2]]
+    for x0, x1, y0, y1, z0, z1 in zip(
+        start_indices[0],
+        stop_indices[0],
+        start_indices[1],
+        stop_indices[1],
+        start_indices[2],
+        stop_indices[2],
+    ):
         occupied[x0:x1, y0:y1, z0:z1] = True
 
-    segments: list[BoxSpec] = []
-    while True:
-        filled = np.argwhere(occupied)
-        if len(filled) == 0:
-            break
-
-        x0, y0, z0 = (int(value) for value in filled[0])
-        x1 = _expand_x(occupied, x0, y0, z0)
-        y1 = _expand_y(occupied, x0, x1, y0, z0)
-        z1 = _expand_z(occupied, x0, x1, y0, y1, z0)
-
-        occupied[x0:x1, y0:y1, z0:z1] = False
-
-        mins = (x_breaks[x0], y_breaks[y0], z_breaks[z0])
-        maxs = (x_breaks[x1], y_breaks[y1], z_breaks[z1])
-        segments.append(_bounds_to_box(mins, maxs))
+    ranges = _greedy_boxes(occupied)
 
-    return segments
+    return [
+        _bounds_to_box(
+            (x_breaks[x0], y_breaks[y0], z_breaks[z0]),
+            (x_breaks[x1], y_breaks[y1], z_breaks[z1]),
+        )
+        for x0, x1, y0, y1, z0, z1 in ranges
+    ]
 
 
 def mesh_face_sides(mesh, *, collapse_caps: bool = False) -> list[FaceSide | None]:
@@ -86,14 +232,15 @@ def mesh_face_sides(mesh, *, collapse_caps: bool = False) -> list[FaceSide | Non
     if faces.ndim != 2 or faces.shape[1] != 3:
         raise ValueError("Wall mesh must be triangulated")
 
-    face_sides: list[FaceSide | None] = []
-    for face in faces:
-        _, dominant_axis, dominant_sign = _face_normal_metadata(vertices, face)
-        if dominant_axis == 2 and not collapse_caps:
-            face_sides.append(None)
-            continue
-        face_sides.append("right" if dominant_sign >= 0 else "left")
-    return face_sides
+    triangles = vertices[faces]
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    dominant_axes = np.argmax(np.abs(normals), axis=1)
+    dominant_signs = np.take_along_axis(normals, dominant_axes[:, None], axis=1)[:, 0]
+
+    face_sides = np.where(dominant_signs >= 0, "right", "left").astype(object)
+    if not collapse_caps:
+        face_sides[dominant_axes == 2] = None
+    return face_sides.tolist()
 
 
 def mesh_face_varying_uvs(
@@ -102,6 +249,16 @@ def mesh_face_varying_uvs(
     uv_mode: UvMode = "repeat",
     face_uv_modes: Sequence[UvMode] | None = None,
 ) -> np.ndarray:
+    return mesh_face_varying_attributes(mesh, uv_mode=uv_mode, face_uv_modes=face_uv_modes)[1]
+
+
+def mesh_face_varying_attributes(
+    mesh,
+    *,
+    uv_mode: UvMode = "repeat",
+    face_uv_modes: Sequence[UvMode] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return face-varying (F*3, 3) positions and (F*3, 2) UVs from a single vertex gather."""
     normalized_uv_mode = _normalize_uv_mode(uv_mode)
     normalized_face_uv_modes: list[UvMode] | None = None
     vertices = np.asarray(mesh.vertices, dtype=np.float64)
@@ -116,60 +273,69 @@ def mesh_face_varying_uvs(
             )
         normalized_face_uv_modes = [_normalize_uv_mode(value) for value in face_uv_modes]
 
-    uvs = np.empty((faces.shape[0] * 3, 2), dtype=np.float64)
-    component_labels: np.ndarray | None = None
-    component_bounds: tuple[np.ndarray, np.ndarray] | None = None
+    face_stretch = np.zeros(len(faces), dtype=bool)
+    if normalized_face_uv_modes is not None:
+        face_stretch[:] = [value == "stretch" for value in normalized_face_uv_modes]
+    elif normalized_uv_mode == "stretch":
+        face_stretch[:] = True
 
-    if len(faces) and (
-        normalized_uv_mode == "stretch"
-        or (normalized_face_uv_modes is not None and any(value == "stretch" for value in normalized_face_uv_modes))
-    ):
-        component_labels = _face_components(len(faces), np.asarray(mesh.face_adjacency, dtype=np.int64))
-        component_bounds = _component_bounds(vertices, faces, component_labels)
-
-    for face_idx, face in enumerate(faces):
-        v0, v1, v2 = vertices[face]
-        _, dominant_axis, _ = _face_normal_metadata(vertices, face)
-        base = 3 * face_idx
-
-        face_component_bounds = None
-        if component_labels is not None and component_bounds is not None:
-            component_index = int(component_labels[face_idx])
-            mins, maxs = component_bounds
-            face_component_bounds = mins[component_index], maxs[component_index]
-
-        face_uv_mode = normalized_uv_mode
-        if normalized_face_uv_modes is not None:
-            face_uv_mode = normalized_face_uv_modes[face_idx]
-
-        for local_idx, vertex in enumerate((v0, v1, v2)):
-            u, v = _project_uv(
-                vertex,
-                dominant_axis,
-                component_bounds=face_component_bounds,
-                stretch=face_uv_mode == "stretch",
-            )
-            uvs[base + local_idx] = (u, v)
+    triangles = vertices[faces]
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    dominant_axes = np.argmax(np.abs(normals), axis=1)
+    uv_axes = _UV_AXES_BY_DOMINANT_AXIS[dominant_axes]
+    uvs = np.take_along_axis(triangles, uv_axes[:, None, :], axis=2)
 
-    return uvs
+    if face_stretch.any():
+        component_labels = _connected_components(len(faces), np.asarray(mesh.face_adjacency, dtype=np.int64))
+        mins, maxs = _component_bounds(vertices, faces, component_labels)
+        lower = np.take_along_axis(mins[component_labels], uv_axes, axis=1)[:, None, :]
+        span = np.take_along_axis(maxs[component_labels], uv_axes, axis=1)[:, None, :] - lower
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalized = np.clip((uvs - lower) / span, 0.0, 1.0)
+        normalized = np.where(span <= 1e-9, 0.0, normalized)
+        uvs = np.where(face_stretch[:, None, None], normalized, uvs)
 
+    return triangles.reshape(-1, 3), uvs.reshape(-1, 2)
 
-def trimesh_to_usd_data(
+
+def trimesh_to_usd_arrays(
     mesh,
     *,
     uv_mode: UvMode = "repeat",
     face_uv_modes: Sequence[UvMode] | None = None,
-) -> tuple[list, list[int], list[int], list]:
-    """Convert trimesh to USD mesh data with face-varying UVs."""
-    vertices = [Gf.Vec3f(*vertex) for vertex in mesh.vertices]
-    face_counts = [3] * len(mesh.faces)
-    face_indices = mesh.faces.flatten().tolist()
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Convert trimesh to float32/int32 USD mesh buffers with face-varying UVs."""
+    vertices = np.ascontiguousarray(mesh.vertices, dtype=np.float32)
+    face_counts = np.full(len(mesh.faces), 3, dtype=np.int32)
+    face_indices = np.ascontiguousarray(mesh.faces.reshape(-1), dtype=np.int32)
     uv_array = mesh_face_varying_uvs(mesh, uv_mode=uv_mode, face_uv_modes=face_uv_modes)
-    uvs = [Gf.Vec2f(float(u), float(v)) for u, v in uv_array]
+    uvs = np.ascontiguousarray(uv_array, dtype=np.float32)
 
     return vertices, face_counts, face_indices, uvs
 
 
+def trimesh_to_usd_data(
+    mesh,
+    *,
+    uv_mode: UvMode = "repeat",
+    face_uv_modes: Sequence[UvMode] | None = None,
+) -> tuple[Vt.Vec3fArray, Vt.IntArray, Vt.IntArray, Vt.Vec2fArray]:
+    """Convert trimesh to USD mesh data with face-varying UVs."""
+    from pxr import Vt
+
+    vertices, face_counts, face_indices, uvs = trimesh_to_usd_arrays(
+        mesh,
+        uv_mode=uv_mode,
+        face_uv_modes=face_uv_modes,
+    )
+    return (
+        Vt.Vec3fArray.FromNumpy(vertices),
+        Vt.IntArray.FromNumpy(face_counts),
+        Vt.IntArray.FromNumpy(face_indices),
+        Vt.Vec2fArray.FromNumpy(uvs),
+    )
+
+
 def _normalize_uv_mode(value: str) -> UvMode:
     normalized = str(value).strip().lower()
     if normalized not in {"repeat", "stretch"}:
@@ -177,43 +343,22 @@ def _normalize_uv_mode(value: str) -> UvMode:
     return cast(UvMode, normalized)
 
 
-def _face_components(face_count: int, face_adjacency: np.ndarray) -> np.ndarray:
-    labels = np.full(face_count, -1, dtype=np.int64)
-    neighbors: list[list[int]] = [[] for _ in range(face_count)]
-
-    for face_a, face_b in face_adjacency:
-        a = int(face_a)
-        b = int(face_b)
-        neighbors[a].append(b)
-        neighbors[b].append(a)
+def _connected_components(node_count: int, edges: np.ndarray) -> np.ndarray:
+    labels = np.arange(node_count, dtype=np.int64)
+    if edges.size:
+        node_a = edges[:, 0]
+        node_b = edges[:, 1]
+        while True:
+            lowest = np.minimum(labels[node_a], labels[node_b])
+            updated = labels.copy()
+            np.minimum.at(updated, node_a, lowest)
+            np.minimum.at(updated, node_b, lowest)
+            updated = updated[updated]
+            if np.array_equal(updated, labels):
+                break
+            labels = updated
 
-    component_index = 0
-    for start_face in range(face_count):
-        if labels[start_face] != -1:
-            continue
-
-        stack = [start_face]
-        labels[start_face] = component_index
-        while stack:
-            face_index = stack.pop()
-            for neighbor in neighbors[face_index]:
-                if labels[neighbor] != -1:
-                    continue
-                labels[neighbor] = component_index
-                stack.append(neighbor)
-
-        component_index += 1
-
-    return labels
-
-
-def _face_normal_metadata(vertices: np.ndarray, face: np.ndarray) -> tuple[np.ndarray, int, float]:
-    v0, v1, v2 = vertices[face]
-    edge1 = v1 - v0
-    edge2 = v2 - v0
-    normal = np.cross(edge1, edge2)
-    dominant_axis = int(np.argmax(np.abs(normal)))
-    return normal, dominant_axis, float(normal[dominant_axis])
+    return np.unique(labels, return_inverse=True)[1].reshape(-1)
 
 
 def _component_bounds(
@@ -225,87 +370,48 @@ def _component_bounds(
     mins = np.full((component_count, 3), np.inf, dtype=np.float64)
     maxs = np.full((component_count, 3), -np.inf, dtype=np.float64)
 
-    for face_index, face in enumerate(faces):
-        component_index = int(component_labels[face_index])
-        face_vertices = vertices[face]
-        mins[component_index] = np.minimum(mins[component_index], np.min(face_vertices, axis=0))
-        maxs[component_index] = np.maximum(maxs[component_index], np.max(face_vertices, axis=0))
-
+    triangles = vertices[faces]
+    np.minimum.at(mins, component_labels, triangles.min(axis=1))
+    np.maximum.at(maxs, component_labels, triangles.max(axis=1))
     return mins, maxs
 
 
-def _project_uv(
-    vertex: np.ndarray,
-    dominant_axis: int,
-    *,
-    component_bounds: tuple[np.ndarray, np.ndarray] | None,
-    stretch: bool,
-) -> tuple[float, float]:
-    if dominant_axis == 0:
-        u_axis, v_axis = 1, 2
-    elif dominant_axis == 1:
-        u_axis, v_axis = 0, 2
-    else:
-        u_axis, v_axis = 0, 1
-
-    u = float(vertex[u_axis])
-    v = float(vertex[v_axis])
-    if not stretch or component_bounds is None:
-        return u, v
-
-    mins, maxs = component_bounds
-    return (
-        _normalize_uv_coordinate(u, mins[u_axis], maxs[u_axis]),
-        _normalize_uv_coordinate(v, mins[v_axis], maxs[v_axis]),
-    )
+def _greedy_boxes(occupied: np.ndarray) -> list[tuple[int, int, int, int, int, int]]:
+    ranges = []
+    flat_occupied = occupied.reshape(-1)
+    cursor = 0
+    while cursor < flat_occupied.size:
+        seed = cursor + int(flat_occupied[cursor:].argmax())
+        if not flat_occupied[seed]:
+            break
+        cursor = seed
 
+        x0, y0, z0 = (int(value) for value in np.unravel_index(seed, occupied.shape))
+        x1 = _expand_x(occupied, x0, y0, z0)
+        y1 = _expand_y(occupied, x0, x1, y0, z0)
+        z1 = z0 + 1 if occupied.shape[2] == 1 else _expand_z(occupied, x0, x1, y0, y1, z0)
 
-def _normalize_uv_coordinate(value: float, lower: float, upper: float) -> float:
-    span = upper - lower
-    if span <= 1e-9:
-        return 0.0
-    normalized = (value - lower) / span
-    if normalized < 0.0:
-        return 0.0
-    if normalized > 1.0:
-        return 1.0
-    return float(normalized)
+        occupied[x0:x1, y0:y1, z0:z1] = False
+        ranges.append((x0, x1, y0, y1, z0, z1))
+    return ranges
 
 
 def _expand_x(occupied: np.ndarray, x0: int, y0: int, z0: int) -> int:
-    x1 = x0 + 1
-    while x1 < occupied.shape[0] and occupied[x1, y0, z0]:
-        x1 += 1
-    return x1
+    return x0 + 1 + _leading_true_count(occupied[x0 + 1 :, y0, z0])
 
 
 def _expand_y(occupied: np.ndarray, x0: int, x1: int, y0: int, z0: int) -> int:
-    y1 = y0 + 1
-    while y1 < occupied.shape[1] and np.all(occupied[x0:x1, y1, z0]):
-        y1 += 1
-    return y1
+    return y0 + 1 + _leading_true_count(occupied[x0:x1, y0 + 1 :, z0].all(axis=0))
 
 
 def _expand_z(occupied: np.ndarray, x0: int, x1: int, y0: int, y1: int, z0: int) -> int:
-    z1 = z0 + 1
-    while z1 < occupied.shape[2] and np.all(occupied[x0:x1, y0:y1, z1]):
-        z1 += 1
-    return z1
-
-
-def _box_bounds(center: Vec3, size: Vec3, *, decimals: int) -> tuple[Vec3, Vec3]:
-    half_size = (size[0] / 2.0, size[1] / 2.0, size[2] / 2.0)
-    mins = (
-        _quantize(center[0] - half_size[0], decimals=decimals),
-        _quantize(center[1] - half_size[1], decimals=decimals),
-        _quantize(center[2] - half_size[2], decimals=decimals),
-    )
-    maxs = (
-        _quantize(center[0] + half_size[0], decimals=decimals),
-        _quantize(center[1] + half_size[1], decimals=decimals),
-        _quantize(center[2] + half_size[2], decimals=decimals),
-    )
-    return mins, maxs
+    return z0 + 1 + _leading_true_count(occupied[x0:x1, y0:y1, z0 + 1 :].all(axis=(0, 1)))
+
+
+def _leading_true_count(values: np.ndarray) -> int:
+    if values.all():
+        return int(values.size)
+    return int(values.argmin())
 
 
 def _bounds_to_box(mins: Vec3, maxs: Vec3) -> BoxSpec:
@@ -322,10 +428,9 @@ def _bounds_to_box(mins: Vec3, maxs: Vec3) -> BoxSpec:
     return center, size
 
 
-def _quantize(value: float, *, decimals: int) -> float:
-    rounded = float(round(float(value), decimals))
-    if rounded == -0.0:
-        return 0.0
+def _quantize(values: np.ndarray, *, decimals: int) -> np.ndarray:
+    rounded = np.round(values, decimals)
+    rounded[rounded == 0.0] = 0.0
     return rounded
 
 
@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol, Sequence
+from typing import Any, Protocol, Sequence
 
+import numpy as np
 from py_ant_maze import Maze
+from py_ant_maze.runtime import value_mask
 
 from .models import MazeGeometry, WallBox
 
 Grid = Sequence[Sequence[int]]
 WallValueMap = dict[int, str]
 
+_INT64_MIN = int(np.iinfo(np.int64).min)
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
 
 class GeometryExtractor(Protocol):
     def extract(self, maze: Maze) -> MazeGeometry:
@@ -29,30 +34,29 @@ def extract_geometry(maze: Maze) -> MazeGeometry:
 @dataclass(frozen=True, slots=True)
 class OccupancyGridExtractor:
     def extract(self, maze: Maze) -> MazeGeometry:
+        config = maze.config
         grid = maze.layout.grid
-        rows, cols = _validate_rectangular_grid("layout.grid", grid)
-        cell_size = _validate_positive_scalar("cell_size", maze.config.cell_size)
-        wall_height = _validate_positive_scalar("wall_height", maze.config.wall_height)
-        wall_map = _wall_value_map(maze)
-        cell_values = {element.value for element in maze.config.cell_elements.elements()}
-        known_values = set(wall_map).union(cell_values)
-
-        walls: list[WallBox] = []
-        for row in range(rows):
-            for col in range(cols):
-                value = grid[row][col]
-                if value not in known_values:
-                    raise ValueError(f"Unknown grid value {value} at layout.grid[{row}][{col}]")
-                element_name = wall_map.get(value)
-                if element_name is None:
-                    continue
-                walls.append(
-                    WallBox(
-                        center=((col + 0.5) * cell_size, (row + 0.5) * cell_size, wall_height / 2.0),
-                        size=(cell_size, cell_size, wall_height),
-                        element_name=element_name,
-                    )
-                )
+        values = _validate_rectangular_grid("layout.grid", grid)
+        rows, cols = values.shape
+        cell_size = _validate_positive_scalar("cell_size", config.cell_size)
+        wall_height = _validate_positive_scalar("wall_height", config.wall_height)
+        wall_map = _wall_value_map(config)
+        cell_values = {element.value for element in config.cell_elements.elements()}
+        known = value_mask(values, frozenset(wall_map).union(cell_values))
+        if not known.all():
+            row, col = (int(index) for index in np.unravel_index(np.argmin(known), known.shape))
+            raise ValueError(f"Unknown grid value {grid[row][col]} at layout.grid[{row}][{col}]")
+
+        wall_rows, wall_cols = np.nonzero(value_mask(values, frozenset(wall_map)))
+        center_xs = ((wall_cols + 0.5) * cell_size).tolist()
+        center_ys = ((wall_rows + 0.5) * cell_size).tolist()
+        names = _wall_names(wall_map, values[wall_rows, wall_cols])
+        center_z = wall_height / 2.0
+        size = (cell_size, cell_size, wall_height)
+        walls = [
+            WallBox._unchecked((x, y, center_z), size, name)
+            for x, y, name in zip(center_xs, center_ys, names)
+        ]
 
         return MazeGeometry.from_walls(walls, bounds=(cols * cell_size, rows * cell_size, wall_height))
 
@@ -60,47 +64,46 @@ class OccupancyGridExtractor:
 @dataclass(frozen=True, slots=True)
 class EdgeGridExtractor:
     def extract(self, maze: Maze) -> MazeGeometry:
-        cells = maze.layout.cells
-        rows, cols = _validate_rectangular_grid("layout.cells", cells)
-        v_walls = maze.layout.vertical_walls
-        h_walls = maze.layout.horizontal_walls
-        _validate_grid_shape("layout.vertical_walls", v_walls, expected_rows=rows, expected_cols=cols + 1)
-        _validate_grid_shape("layout.horizontal_walls", h_walls, expected_rows=rows + 1, expected_cols=cols)
-
-        cell_size = _validate_positive_scalar("cell_size", maze.config.cell_size)
-        wall_height = _validate_positive_scalar("wall_height", maze.config.wall_height)
-        wall_thickness = _validate_positive_scalar("wall_thickness", maze.config.wall_thickness)
-        wall_map = _wall_value_map(maze)
-
-        walls: list[WallBox] = []
-        for row in range(rows):
-            for col in range(cols + 1):
-                value = v_walls[row][col]
-                # Match edge-grid rendering semantics: only strictly positive wall values are solid.
-                if value <= 0:
-                    continue
-                element_name = _resolve_wall_name(wall_map, value, "layout.vertical_walls", row, col)
-                walls.append(
-                    WallBox(
-                        center=(col * cell_size, (row + 0.5) * cell_size, wall_height / 2.0),
-                        size=(wall_thickness, cell_size, wall_height),
-                        element_name=element_name,
-                    )
-                )
-
-        for row in range(rows + 1):
-            for col in range(cols):
-                value = h_walls[row][col]
-                if value <= 0:
-                    continue
-                element_name = _resolve_wall_name(wall_map, value, "layout.horizontal_walls", row, col)
-                walls.append(
-                    WallBox(
-                        center=((col + 0.5) * cell_size, row * cell_size, wall_height / 2.0),
-                        size=(cell_size, wall_thickness, wall_height),
-                        element_name=element_name,
-                    )
-                )
+        config = maze.config
+        layout = maze.layout
+        rows, cols = _validate_rectangular_grid("layout.cells", layout.cells).shape
+        v_walls = layout.vertical_walls
+        h_walls = layout.horizontal_walls
+        v_values = _validate_grid_shape(
+            "layout.vertical_walls", v_walls, expected_rows=rows, expected_cols=cols + 1
+        )
+        h_values = _validate_grid_shape(
+            "layout.horizontal_walls", h_walls, expected_rows=rows + 1, expected_cols=cols
+        )
+
+        cell_size = _validate_positive_scalar("cell_size", config.cell_size)
+        wall_height = _validate_positive_scalar("wall_height", config.wall_height)
+        wall_thickness = _validate_positive_scalar("wall_thickness", config.wall_thickness)
+        wall_map = _wall_value_map(config)
+
+        # Match edge-grid rendering semantics: only strictly positive wall values are solid.
+        v_rows, v_cols, v_names = _solid_wall_cells(wall_map, v_values, v_walls, "layout.vertical_walls")
+        h_rows, h_cols, h_names = _solid_wall_cells(wall_map, h_values, h_walls, "layout.horizontal_walls")
+
+        center_z = wall_height / 2.0
+        v_size = (wall_thickness, cell_size, wall_height)
+        h_size = (cell_size, wall_thickness, wall_height)
+        walls = [
+            WallBox._unchecked((x, y, center_z), v_size, name)
+            for x, y, name in zip(
+                (v_cols * cell_size).tolist(),
+                ((v_rows + 0.5) * cell_size).tolist(),
+                v_names,
+            )
+        ]
+        walls.extend(
+            WallBox._unchecked((x, y, center_z), h_size, name)
+            for x, y, name in zip(
+                ((h_cols + 0.5) * cell_size).tolist(),
+                (h_rows * cell_size).tolist(),
+                h_names,
+            )
+        )
 
         return MazeGeometry.from_walls(walls, bounds=(cols * cell_size, rows * cell_size, wall_height))
 
@@ -111,24 +114,34 @@ _EXTRACTORS: dict[str, GeometryExtractor] = {
 }
 
 
-def _wall_value_map(maze: Maze) -> WallValueMap:
-    wall_elements = maze.config.wall_elements.elements()
+def _wall_value_map(config: Any) -> WallValueMap:
+    wall_elements = config.wall_elements.elements()
     if not wall_elements:
         raise ValueError("maze config must contain at least one wall element")
     return {element.value: element.name for element in wall_elements}
 
 
-def _resolve_wall_name(
+def _solid_wall_cells(
     wall_map: WallValueMap,
-    value: int,
+    values: np.ndarray,
+    grid: Grid,
     grid_name: str,
-    row: int,
-    col: int,
-) -> str:
-    element_name = wall_map.get(value)
-    if element_name is None:
-        raise ValueError(f"Unknown wall value {value} at {grid_name}[{row}][{col}]")
-    return element_name
+) -> tuple[np.ndarray, np.ndarray, list[str]]:
+    rows, cols = np.nonzero(values > 0)
+    solid_values = values[rows, cols]
+    known = value_mask(solid_values, frozenset(wall_map))
+    if not known.all():
+        first = int(np.argmin(known))
+        row, col = int(rows[first]), int(cols[first])
+        raise ValueError(f"Unknown wall value {grid[row][col]} at {grid_name}[{row}][{col}]")
+
+    return rows, cols, _wall_names(wall_map, solid_values)
+
+
+def _wall_names(wall_map: WallValueMap, values: np.ndarray) -> list[str]:
+    unique_values, inverse = np.unique(values, return_inverse=True)
+    names_by_value = np.array([wall_map[value] for value in unique_values.tolist()], dtype=object)
+    return names_by_value[inverse.reshape(-1)].tolist()
 
 
 def _validate_positive_scalar(name: str, value: float) -> float:
@@ -139,18 +152,34 @@ def _validate_positive_scalar(name: str, value: float) -> float:
     return float(value)
 
 
-def _validate_grid_shape(grid_name: str, grid: Grid, *, expected_rows: int, expected_cols: int) -> None:
-    rows, cols = _validate_rectangular_grid(grid_name, grid)
+def _validate_grid_shape(grid_name: str, grid: Grid, *, expected_rows: int, expected_cols: int) -> np.ndarray:
+    values = _validate_rectangular_grid(grid_name, grid)
+    rows, cols = values.shape
     if rows != expected_rows or cols != expected_cols:
         raise ValueError(f"{grid_name} must be {expected_rows}x{expected_cols}, got {rows}x{cols}")
+    return values
 
 
-def _validate_rectangular_grid(grid_name: str, grid: Grid) -> tuple[int, int]:
+def _validate_rectangular_grid(grid_name: str, grid: Grid) -> np.ndarray:
     if not isinstance(grid, (list, tuple)):
         raise TypeError(f"{grid_name} must be a sequence of rows")
     if not grid:
         raise ValueError(f"{grid_name} cannot be empty")
 
+    if all(isinstance(row, (list, tuple)) for row in grid):
+        try:
+            values = np.asarray(grid)
+        except ValueError:
+            values = None
+        if (
+            values is not None
+            and values.ndim == 2
+            and values.shape[1] > 0
+            and values.dtype.kind in "biu"
+            and values.dtype != np.uint64
+        ):
+            return values.astype(np.int64, copy=False)
+
     cols = None
     for row_index, row in enumerate(grid):
         if not isinstance(row, (list, tuple)):
@@ -166,4 +195,11 @@ def _validate_rectangular_grid(grid_name: str, grid: Grid) -> tuple[int, int]:
             if not isinstance(value, int):
                 raise TypeError(f"{grid_name}[{row_index}][{col_index}] must be an integer")
 
-    return len(grid), cols
+    try:
+        return np.asarray(grid, dtype=np.int64)
+    except OverflowError:
+        return np.array([[_saturate_int64(value) for value in row] for row in grid], dtype=np.int64)
+
+
+def _saturate_int64(value: int) -> int:
+    return min(max(value, _INT64_MIN), _INT64_MAX)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, Literal
+import sys
+from dataclasses import dataclass, field
+from typing import Iterable, Literal, Sequence
+
+import numpy as np
 
 Vec3 = tuple[float, float, float]
 CoordinateFrame = Literal["config", "simulation_genesis", "simulation_isaac"]
@@ -25,16 +28,20 @@ _CANONICAL_COORDINATE_FRAMES = (
 def _validate_vec3(value: Vec3, *, field_name: str) -> None:
     if len(value) != 3:
         raise ValueError(f"{field_name} must have exactly 3 values")
-    for component in value:
-        if not isinstance(component, (int, float)):
-            raise TypeError(f"{field_name} values must be numeric")
+    x, y, z = value
+    if not (isinstance(x, (int, float)) and isinstance(y, (int, float)) and isinstance(z, (int, float))):
+        raise TypeError(f"{field_name} values must be numeric")
 
 
 def _validate_positive_vec3(value: Vec3, *, field_name: str) -> None:
     _validate_vec3(value, field_name=field_name)
-    for component in value:
-        if component <= 0:
-            raise ValueError(f"{field_name} values must be > 0")
+    x, y, z = value
+    if x <= 0 or y <= 0 or z <= 0:
+        raise ValueError(f"{field_name} values must be > 0")
+
+
+def _intern_name(name: str) -> str:
+    return sys.intern(name) if type(name) is str else name
 
 
 def normalize_coordinate_frame(value: str) -> str:
@@ -57,6 +64,43 @@ class WallBox:
             raise ValueError("element_name must be non-empty")
         _validate_vec3(self.center, field_name="center")
         _validate_positive_vec3(self.size, field_name="size")
+        object.__setattr__(self, "element_name", _intern_name(self.element_name))
+
+    @classmethod
+    def _unchecked(cls, center: Vec3, size: Vec3, element_name: str) -> "WallBox":
+        wall = object.__new__(cls)
+        object.__setattr__(wall, "center", center)
+        object.__setattr__(wall, "size", size)
+        object.__setattr__(wall, "element_name", _intern_name(element_name))
+        return wall
+
+
+@dataclass(frozen=True, slots=True)
+class WallArrays:
+    """Column view of a wall sequence: one contiguous array per WallBox field."""
+
+    centers: np.ndarray
+    sizes: np.ndarray
+    element_ids: np.ndarray
+    element_names: tuple[str, ...]
+
+    @classmethod
+    def from_walls(cls, walls: Sequence[WallBox]) -> "WallArrays":
+        element_names = tuple(sorted({wall.element_name for wall in walls}))
+        id_by_name = {name: index for index, name in enumerate(element_names)}
+        centers = np.array([wall.center for wall in walls], dtype=np.float64).reshape(-1, 3)
+        sizes = np.array([wall.size for wall in walls], dtype=np.float64).reshape(-1, 3)
+        element_ids = np.fromiter(
+            (id_by_name[wall.element_name] for wall in walls),
+            dtype=np.intp,
+            count=len(walls),
+        )
+        for array in (centers, sizes, element_ids):
+            array.setflags(write=False)
+        return cls(centers, sizes, element_ids, element_names)
+
+    def __len__(self) -> int:
+        return len(self.element_ids)
 
 
 @dataclass(frozen=True, slots=True)
@@ -64,6 +108,7 @@ class MazeGeometry:
     walls: tuple[WallBox, ...]
     bounds: Vec3
     frame: CoordinateFrame = "config"
+    _wall_arrays: WallArrays | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         _validate_positive_vec3(self.bounds, field_name="bounds")
@@ -86,7 +131,15 @@ class MazeGeometry:
 
     @property
     def element_names(self) -> tuple[str, ...]:
-        return tuple(sorted({wall.element_name for wall in self.walls}))
+        return self.wall_arrays.element_names
+
+    @property
+    def wall_arrays(self) -> WallArrays:
+        arrays = self._wall_arrays
+        if arrays is None:
+            arrays = WallArrays.from_walls(self.walls)
+            object.__setattr__(self, "_wall_arrays", arrays)
+        return arrays
 
     def to_frame(self, target_frame: CoordinateFrame) -> "MazeGeometry":
         normalized_target = normalize_coordinate_frame(target_frame)
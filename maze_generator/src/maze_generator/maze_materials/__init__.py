@@ -1,9 +1,8 @@
 """Materials package."""
 
+from .._lazy import lazy_module_attributes
 from .color import Color, ColorResolver, MaterialMap, resolve_color
-from .discovery import discover_all_default_materials, discover_default_materials, get_default_assets_path
 from .source import MaterialSource, UsdMaterialRef
-from .usd_nodes import create_preview_material, create_texture_material, reference_usd_material
 
 __all__ = [
     "Color",
@@ -19,3 +18,15 @@ __all__ = [
     "reference_usd_material",
     "resolve_color",
 ]
+
+__getattr__, __dir__ = lazy_module_attributes(
+    globals(),
+    {
+        "create_preview_material": ".usd_nodes",
+        "create_texture_material": ".usd_nodes",
+        "discover_all_default_materials": ".discovery",
+        "discover_default_materials": ".discovery",
+        "get_default_assets_path": ".discovery",
+        "reference_usd_material": ".usd_nodes",
+    },
+)
@@ -29,20 +29,7 @@ class ColorResolver:
     _assigned: dict[str, Color] = field(default_factory=dict)
 
     def resolve(self, element_name: str) -> Color:
-        if not element_name:
-            raise ValueError("element_name must be non-empty")
-        if self.material_map is not None and element_name in self.material_map:
-            color = self.material_map[element_name]
-            _validate_color(color, field_name=f"material_map[{element_name!r}]")
-            return color
-        if element_name in _DEFAULT_COLORS:
-            return _DEFAULT_COLORS[element_name]
-        color = self._assigned.get(element_name)
-        if color is not None:
-            return color
-        color = _PALETTE[len(self._assigned) % len(_PALETTE)]
-        self._assigned[element_name] = color
-        return color
+        return _resolve_color(element_name, self.material_map, self._assigned)
 
 
 def resolve_color(
@@ -50,12 +37,30 @@ def resolve_color(
     material_map: MaterialMap | None,
     cache: dict[str, Color] | None = None,
 ) -> Color:
-    resolver = ColorResolver(material_map=material_map)
-    if cache:
-        resolver._assigned.update(cache)
-    color = resolver.resolve(element_name)
-    if cache is not None and element_name not in cache and element_name not in _DEFAULT_COLORS:
-        cache[element_name] = color
+    color = _resolve_color(element_name, material_map, cache if cache is not None else {})
+    if cache is not None and element_name not in _DEFAULT_COLORS:
+        cache.setdefault(element_name, color)
+    return color
+
+
+def _resolve_color(
+    element_name: str,
+    material_map: MaterialMap | None,
+    assigned: dict[str, Color],
+) -> Color:
+    if not element_name:
+        raise ValueError("element_name must be non-empty")
+    if material_map is not None and element_name in material_map:
+        color = material_map[element_name]
+        _validate_color(color, field_name=f"material_map[{element_name!r}]")
+        return color
+    if element_name in _DEFAULT_COLORS:
+        return _DEFAULT_COLORS[element_name]
+    color = assigned.get(element_name)
+    if color is not None:
+        return color
+    color = _PALETTE[len(assigned) % len(_PALETTE)]
+    assigned[element_name] = color
     return color
 
 
@@ -66,6 +71,16 @@ def validate_color(color: Color, *, field_name: str) -> None:
 def _validate_color(color: Color, *, field_name: str) -> None:
     if len(color) != 3:
         raise ValueError(f"{field_name} must have exactly 3 values")
+    r, g, b = color
+    if (
+        isinstance(r, (int, float))
+        and isinstance(g, (int, float))
+        and isinstance(b, (int, float))
+        and 0 <= r <= 1
+        and 0 <= g <= 1
+        and 0 <= b <= 1
+    ):
+        return
     for component in color:
         if not isinstance(component, (int, float)):
             raise TypeError(f"{field_name} values must be numeric")
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from pxr import Usd, UsdShade
 
@@ -11,8 +16,10 @@ from .source import MaterialSource, UsdMaterialRef
 
 ALL_TEXTURE_PATTERNS: tuple[str, ...] = ("*.jpg", "*.jpeg", "*.png", "*.exr", "*.tif", "*.tiff")
 ALL_USD_PATTERNS: tuple[str, ...] = ("*.usd", "*.usda", "*.usdc", "*.usdz")
+_MAX_STAGE_OPEN_WORKERS = 8
 
 
+@lru_cache(maxsize=1)
 def get_default_assets_path() -> Path:
     assets_path = Path(__file__).resolve().parent.parent / "default_assets"
     if not assets_path.is_dir():
@@ -75,7 +82,7 @@ def _discover_materials(
             f"materials_path={materials_path} patterns=[{usd_patterns_repr}]"
         )
 
-    return MaterialSource(textures=textures, usd_materials=usd_materials)
+    return MaterialSource._unchecked(textures, usd_materials)
 
 
 def _normalize_patterns(patterns: Iterable[str], *, label: str) -> list[str]:
@@ -103,8 +110,10 @@ def _discover_textures(textures_path: Path, patterns: list[str]) -> dict[str, st
 
 def _discover_usd_materials(materials_path: Path, patterns: list[str]) -> dict[str, UsdMaterialRef]:
     usd_materials: dict[str, UsdMaterialRef] = {}
-    for material_file in _discover_files(materials_path, patterns, recursive=True):
-        stage = Usd.Stage.Open(str(material_file.resolve()))
+    material_files = _discover_files(materials_path, patterns, recursive=True)
+    resolved_files = [str(material_file.resolve()) for material_file in material_files]
+    stages = _open_stages(resolved_files)
+    for material_file, resolved_file, stage in zip(material_files, resolved_files, stages):
         if stage is None:
             raise RuntimeError(f"Failed to open USD file during material discovery: {material_file}")
 
@@ -120,7 +129,7 @@ def _discover_usd_materials(materials_path: Path, patterns: list[str]) -> dict[s
             _insert_unique(
                 usd_materials,
                 _single_material_element_name(materials_path, material_file),
-                UsdMaterialRef(file=str(material_file.resolve()), path=material_paths[0]),
+                UsdMaterialRef(file=resolved_file, path=material_paths[0]),
                 asset_kind="USD material",
             )
             continue
@@ -130,22 +139,47 @@ def _discover_usd_materials(materials_path: Path, patterns: list[str]) -> dict[s
             _insert_unique(
                 usd_materials,
                 element_name,
-                UsdMaterialRef(file=str(material_file.resolve()), path=material_path),
+                UsdMaterialRef(file=resolved_file, path=material_path),
                 asset_kind="USD material",
             )
     return usd_materials
 
 
+def _open_stages(files: list[str]) -> list[Usd.Stage | None]:
+    if len(files) <= 1:
+        return [Usd.Stage.Open(file) for file in files]
+    with ThreadPoolExecutor(max_workers=min(len(files), _MAX_STAGE_OPEN_WORKERS)) as executor:
+        return list(executor.map(Usd.Stage.Open, files))
+
+
 def _discover_files(directory: Path, patterns: list[str], *, recursive: bool) -> tuple[Path, ...]:
     found: dict[str, Path] = {}
-    for pattern in patterns:
-        iterator = directory.rglob(pattern) if recursive else directory.glob(pattern)
-        for file_path in sorted(iterator):
-            if file_path.is_file():
-                found[str(file_path.resolve())] = file_path
+    if any(os.sep in pattern or "/" in pattern for pattern in patterns):
+        for pattern in patterns:
+            iterator = directory.rglob(pattern) if recursive else directory.glob(pattern)
+            for file_path in sorted(iterator):
+                if file_path.is_file():
+                    found[str(file_path.resolve())] = file_path
+        return tuple(found[key] for key in sorted(found))
+
+    name_pattern = re.compile("|".join(translate(os.path.normcase(pattern)) for pattern in patterns))
+    for file_path in sorted(_iter_files(directory, recursive=recursive)):
+        if name_pattern.match(os.path.normcase(file_path.name)):
+            found[str(file_path.resolve())] = file_path
     return tuple(found[key] for key in sorted(found))
 
 
+def _iter_files(directory: Path, *, recursive: bool) -> Iterator[Path]:
+    pending = [str(directory)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    yield Path(entry.path)
+
+
 def _single_material_element_name(materials_path: Path, material_file: Path) -> str:
     relative_path = material_file.relative_to(materials_path)
     if len(relative_path.parts) > 1:
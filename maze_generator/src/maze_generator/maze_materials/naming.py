@@ -0,0 +1,7 @@
+"""Name sanitization shared by the USD and OBJ writers."""
+
+from __future__ import annotations
+
+import re
+
+NON_NAME_CHAR = re.compile(r"\W")
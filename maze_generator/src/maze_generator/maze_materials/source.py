@@ -46,6 +46,17 @@ class MaterialSource:
         object.__setattr__(self, "textures", _normalize_textures(self.textures))
         object.__setattr__(self, "usd_materials", _normalize_usd_materials(self.usd_materials))
 
+    @classmethod
+    def _unchecked(
+        cls,
+        textures: dict[str, str],
+        usd_materials: dict[str, UsdMaterialRef],
+    ) -> "MaterialSource":
+        source = object.__new__(cls)
+        object.__setattr__(source, "textures", textures)
+        object.__setattr__(source, "usd_materials", usd_materials)
+        return source
+
     def get_texture(self, element_name: str, *, face: FaceSide | None = None) -> str | None:
         for candidate_name in _material_resolution_names(element_name, face=face):
             texture_path = self.textures.get(candidate_name)
@@ -4,26 +4,39 @@ from __future__ import annotations
 
 import os
 import shutil
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
-import trimesh
 
 from ..maze_boolean.union import (
-    boolean_union_boxes,
+    boolean_union_box_groups,
     convex_segment_boxes,
     create_box_trimesh,
     mesh_face_sides,
-    mesh_face_varying_uvs,
+    mesh_face_varying_attributes,
 )
 from ..maze_geometry.models import MazeGeometry
-from ..maze_materials.color import ColorResolver, MaterialMap
+from ..maze_materials.color import Color, ColorResolver, MaterialMap
+from ..maze_materials.naming import NON_NAME_CHAR
 from ..maze_materials.source import FaceSide, MaterialSource, texture_name_requests_stretch
 
+if TYPE_CHECKING:
+    import trimesh
+
 MaterialKey = tuple[str, FaceSide | None]
 
+_WRITE_BUFFER_SIZE = 1 << 20
+_MTL_MATERIAL_HEADER = (
+    "Ka 0.000000 0.000000 0.000000",
+    "Ks 0.000000 0.000000 0.000000",
+    "d 1.000000",
+    "illum 2",
+)
+
 
 @dataclass(frozen=True, slots=True)
 class ObjChunk:
@@ -35,6 +48,10 @@ class ObjChunk:
     faces: np.ndarray
     uvs: np.ndarray
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "material_name", sys.intern(self.material_name))
+        object.__setattr__(self, "element_name", sys.intern(self.element_name))
+
 
 def write_obj_bundle(
     geometry: MazeGeometry,
@@ -42,6 +59,8 @@ def write_obj_bundle(
     *,
     material_map: MaterialMap | None = None,
     material_source: MaterialSource | None = None,
+    link_textures: bool = False,
+    union_workers: int | None = 1,
 ) -> None:
     if not isinstance(geometry, MazeGeometry):
         raise TypeError("geometry must be MazeGeometry")
@@ -65,6 +84,7 @@ def write_obj_bundle(
         geometry,
         face_override_elements=face_override_elements,
         uv_modes=uv_modes,
+        union_workers=union_workers,
     )
     collider_chunks = _build_collider_chunks(geometry)
 
@@ -75,6 +95,7 @@ def write_obj_bundle(
         material_source=material_source,
         obj_dir=bundle_dir,
         texture_dir=texture_dir,
+        link_textures=link_textures,
     )
     _write_obj_file(visual_obj, visual_mtl.name, visual_chunks)
 
@@ -96,16 +117,18 @@ def _build_visual_chunks(
     *,
     face_override_elements: set[str] | None = None,
     uv_modes: dict[MaterialKey, str] | None = None,
+    union_workers: int | None = 1,
 ) -> list[ObjChunk]:
-    grouped: dict[str, list[tuple[tuple[float, float, float], tuple[float, float, float]]]] = defaultdict(list)
-    for wall in geometry.walls:
-        grouped[wall.element_name].append((wall.center, wall.size))
-
+    walls = geometry.wall_arrays
     chunks: list[ObjChunk] = []
     face_overrides = face_override_elements or set()
     request_uv_modes = uv_modes or {}
-    for element_name, box_specs in sorted(grouped.items()):
-        tmesh = boolean_union_boxes(box_specs)
+    group_masks = (walls.element_ids == element_id for element_id in range(len(walls.element_names)))
+    tmeshes = boolean_union_box_groups(
+        (zip(walls.centers[in_group].tolist(), walls.sizes[in_group].tolist()) for in_group in group_masks),
+        max_workers=union_workers,
+    )
+    for element_name, tmesh in zip(walls.element_names, tmeshes):
         if element_name in face_overrides:
             face_sides = mesh_face_sides(tmesh, collapse_caps=True)
             face_uv_modes = [
@@ -146,7 +169,8 @@ def _build_collider_chunks(geometry: MazeGeometry) -> list[ObjChunk]:
     if not geometry.walls:
         return []
 
-    segments = convex_segment_boxes((wall.center, wall.size) for wall in geometry.walls)
+    walls = geometry.wall_arrays
+    segments = convex_segment_boxes(zip(walls.centers.tolist(), walls.sizes.tolist()))
     chunks: list[ObjChunk] = []
     for segment_index, (center, size) in enumerate(segments):
         tmesh = create_box_trimesh(center, size)
@@ -171,14 +195,12 @@ def _mesh_with_uv(
     uv_mode: str = "repeat",
     face_uv_modes: list[str] | None = None,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    vertices = np.asarray(mesh.vertices, dtype=np.float64)
-    faces = np.asarray(mesh.faces, dtype=np.int64)
-    if faces.ndim != 2 or faces.shape[1] != 3:
-        raise ValueError("Wall mesh must be triangulated")
-
-    expanded_vertices = vertices[faces.reshape(-1)]
+    expanded_vertices, uvs = mesh_face_varying_attributes(
+        mesh,
+        uv_mode=uv_mode,
+        face_uv_modes=face_uv_modes,
+    )
     expanded_faces = np.arange(expanded_vertices.shape[0], dtype=np.int64).reshape(-1, 3)
-    uvs = mesh_face_varying_uvs(mesh, uv_mode=uv_mode, face_uv_modes=face_uv_modes)
 
     return expanded_vertices, expanded_faces, uvs
 
@@ -233,21 +255,22 @@ def _write_obj_file(output: Path, mtl_filename: str, chunks: list[ObjChunk]) ->
         lines.append(f"o {chunk.object_name}")
         lines.append(f"usemtl {chunk.material_name}")
 
-        for x, y, z in chunk.vertices:
-            lines.append(f"v {x:.8f} {y:.8f} {z:.8f}")
-
-        for u, v in chunk.uvs:
-            lines.append(f"vt {u:.8f} {v:.8f}")
-
-        for face in chunk.faces:
-            a, b, c = face + vertex_offset
-            ta, tb, tc = face + uv_offset
-            lines.append(f"f {a}/{ta} {b}/{tb} {c}/{tc}")
+        _append_formatted_rows(lines, "v %.8f %.8f %.8f", chunk.vertices)
+        _append_formatted_rows(lines, "vt %.8f %.8f", chunk.uvs)
+        face_refs = np.empty((len(chunk.faces), 3, 2), dtype=np.int64)
+        face_refs[:, :, 0] = chunk.faces + vertex_offset
+        face_refs[:, :, 1] = chunk.faces + uv_offset
+        _append_formatted_rows(lines, "f %d/%d %d/%d %d/%d", face_refs.reshape(-1, 6))
 
         vertex_offset += len(chunk.vertices)
         uv_offset += len(chunk.uvs)
 
-    output.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    _write_lines(output, lines, trailing_newline=True)
+
+
+def _append_formatted_rows(lines: list[str], row_format: str, rows: np.ndarray) -> None:
+    if len(rows):
+        lines.append("\n".join([row_format] * len(rows)) % tuple(rows.ravel().tolist()))
 
 
 def _write_mtl(
@@ -258,111 +281,137 @@ def _write_mtl(
     material_source: MaterialSource | None,
     obj_dir: Path,
     texture_dir: Path,
+    link_textures: bool = False,
 ) -> None:
     resolver = ColorResolver(material_map=material_map)
-    emitted: set[str] = set()
+    colors: dict[str, Color] = {}
+    diffuse_by_texture: dict[str, str] = {}
     lines: list[str] = ["# Generated by maze_generator"]
-    copied_textures: dict[Path, Path] = {}
+    copied_textures: dict[str, str] = {}
 
+    material_keys: dict[str, tuple[str, FaceSide | None]] = {}
     for chunk in chunks:
-        if chunk.material_name in emitted:
-            continue
-        emitted.add(chunk.material_name)
+        material_keys.setdefault(chunk.material_name, (chunk.element_name, chunk.face_side))
 
+    for material_name, (element_name, face_side) in material_keys.items():
         texture_path: str | None = None
         if material_source is not None:
-            texture_path = material_source.resolve_texture_for_obj(
-                chunk.element_name,
-                face=chunk.face_side,
-            )
+            texture_path = material_source.resolve_texture_for_obj(element_name, face=face_side)
 
-        lines.append(f"newmtl {chunk.material_name}")
-        lines.append("Ka 0.000000 0.000000 0.000000")
-        lines.append("Ks 0.000000 0.000000 0.000000")
-        lines.append("d 1.000000")
-        lines.append("illum 2")
+        lines.append(f"newmtl {material_name}")
+        lines.extend(_MTL_MATERIAL_HEADER)
 
         if texture_path is not None:
-            resolved_texture = _resolve_existing_texture(texture_path)
-            write_texture_path = _copy_texture_to_dir(
-                resolved_texture,
-                texture_dir,
-                copied_textures,
-            )
-            lines.append("Kd 1.000000 1.000000 1.000000")
-            lines.append(f"map_Kd {_to_relative_texture_path(str(write_texture_path), obj_dir)}")
+            diffuse = diffuse_by_texture.get(texture_path)
+            if diffuse is None:
+                resolved_texture = _resolve_existing_texture(texture_path)
+                write_texture_path = _copy_texture_to_dir(
+                    resolved_texture,
+                    texture_dir,
+                    copied_textures,
+                    link=link_textures,
+                )
+                diffuse = (
+                    "Kd 1.000000 1.000000 1.000000\n"
+                    f"map_Kd {_to_relative_texture_path(write_texture_path, obj_dir)}"
+                )
+                diffuse_by_texture[texture_path] = diffuse
+            lines.append(diffuse)
         else:
-            color = resolver.resolve(chunk.element_name)
+            color = colors.get(element_name)
+            if color is None:
+                color = resolver.resolve(element_name)
+                colors[element_name] = color
             lines.append(f"Kd {color[0]:.6f} {color[1]:.6f} {color[2]:.6f}")
 
         lines.append("")
 
-    output.write_text("\n".join(lines), encoding="utf-8")
+    _write_lines(output, lines)
 
 
 def _write_single_color_mtl(output: Path, *, material_name: str, color: tuple[float, float, float]) -> None:
     lines = [
         "# Generated by maze_generator",
         f"newmtl {material_name}",
-        "Ka 0.000000 0.000000 0.000000",
-        "Ks 0.000000 0.000000 0.000000",
-        "d 1.000000",
-        "illum 2",
+        *_MTL_MATERIAL_HEADER,
         f"Kd {color[0]:.6f} {color[1]:.6f} {color[2]:.6f}",
         "",
     ]
-    output.write_text("\n".join(lines), encoding="utf-8")
+    _write_lines(output, lines)
+
 
+def _write_lines(output: Path, lines: list[str], *, trailing_newline: bool = False) -> None:
+    with open(output, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as handle:
+        for index, line in enumerate(lines):
+            if index:
+                handle.write("\n")
+            handle.write(line)
+        if trailing_newline:
+            handle.write("\n")
 
-def _resolve_existing_texture(texture_path: str) -> Path:
-    resolved = Path(texture_path).expanduser().resolve()
-    if not resolved.is_file():
+
+def _resolve_existing_texture(texture_path: str) -> str:
+    resolved = os.path.realpath(os.path.expanduser(texture_path))
+    if not os.path.isfile(resolved):
         raise FileNotFoundError(f"Texture file not found: {texture_path}")
     return resolved
 
 
-def _copy_texture_to_dir(source: Path, texture_dir: Path, copied_textures: dict[Path, Path]) -> Path:
+def _copy_texture_to_dir(
+    source: str,
+    texture_dir: Path,
+    copied_textures: dict[str, str],
+    *,
+    link: bool = False,
+) -> str:
     cached = copied_textures.get(source)
     if cached is not None:
         return cached
 
-    target = texture_dir / source.name
-    if target.exists() and not _same_file(target, source):
-        stem = source.stem
-        suffix = source.suffix
+    texture_dir_str = os.fspath(texture_dir)
+    name = os.path.basename(source)
+    target = os.path.join(texture_dir_str, name)
+    if os.path.exists(target) and not _same_file(target, source):
+        stem, suffix = os.path.splitext(name)
         idx = 1
         while True:
-            candidate = texture_dir / f"{stem}_{idx}{suffix}"
-            if not candidate.exists() or _same_file(candidate, source):
+            candidate = os.path.join(texture_dir_str, f"{stem}_{idx}{suffix}")
+            if not os.path.exists(candidate) or _same_file(candidate, source):
                 target = candidate
                 break
             idx += 1
 
-    if not target.exists():
-        shutil.copy2(source, target)
+    if not os.path.exists(target):
+        _place_texture(source, target, link=link)
 
     copied_textures[source] = target
     return target
 
 
-def _same_file(path_a: Path, path_b: Path) -> bool:
+def _place_texture(source: str, target: str, *, link: bool) -> None:
+    if link:
+        try:
+            os.link(source, target)
+            return
+        except OSError:
+            pass
+    shutil.copy2(source, target)
+
+
+def _same_file(path_a: str, path_b: str) -> bool:
     try:
-        return path_a.samefile(path_b)
+        return os.path.samefile(path_a, path_b)
     except FileNotFoundError:
         return False
 
 
 def _to_relative_texture_path(texture_path: str, obj_dir: Path) -> str:
-    path = Path(texture_path).resolve()
-    try:
-        rel = path.relative_to(obj_dir)
-    except ValueError:
-        rel = Path(os.path.relpath(path, obj_dir))
-    return rel.as_posix()
+    relative = os.path.relpath(os.path.realpath(texture_path), obj_dir)
+    return relative.replace(os.sep, "/")
 
 
 def _sanitize_name(name: str) -> str:
-    clean = "".join(char if char.isalnum() or char == "_" else "_" for char in name.strip())
+    clean = NON_NAME_CHAR.sub("_", name.strip())
     if not clean:
         raise ValueError("Material name cannot be empty after sanitization")
     if clean[0].isdigit():
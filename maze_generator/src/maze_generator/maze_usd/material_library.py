@@ -5,7 +5,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from ..maze_materials.color import ColorResolver, MaterialMap
-from ..maze_materials.source import FaceSide, MaterialSource, texture_name_requests_stretch
+from ..maze_materials.source import (
+    FaceSide,
+    MaterialSource,
+    UsdMaterialRef,
+    texture_name_requests_stretch,
+)
 from ..maze_materials.usd_nodes import (
     create_preview_material,
     create_texture_material,
@@ -14,6 +19,10 @@ from ..maze_materials.usd_nodes import (
 from .mesh_primitives import sanitize_prim_name
 
 
+MaterialRequest = tuple[str, FaceSide | None]
+MaterialResolution = tuple[UsdMaterialRef | None, str | None]
+
+
 @dataclass(frozen=True, slots=True)
 class MaterialLibrary:
     material_map: MaterialMap | None
@@ -22,44 +31,55 @@ class MaterialLibrary:
     def create(
         self,
         stage,
-        material_requests: tuple[tuple[str, FaceSide | None], ...],
-    ) -> dict[tuple[str, FaceSide | None], object]:
-        materials: dict[tuple[str, FaceSide | None], object] = {}
+        material_requests: tuple[MaterialRequest, ...],
+        *,
+        resolved: dict[MaterialRequest, MaterialResolution] | None = None,
+    ) -> dict[MaterialRequest, object]:
+        if resolved is None:
+            resolved = resolve_material_requests(material_requests, self.material_source)
+        materials: dict[MaterialRequest, object] = {}
         color_resolver = ColorResolver(material_map=self.material_map)
 
-        for element_name, face in material_requests:
+        for request in material_requests:
+            element_name, face = request
             mat_path = f"/Maze/Materials/{_material_request_name(element_name, face)}"
-            if self.material_source is not None:
-                usd_material, texture_path = self.material_source.resolve_for_usd(
+            usd_material, texture_path = resolved[request]
+            if usd_material is not None:
+                materials[request] = reference_usd_material(
+                    stage,
+                    mat_path,
+                    usd_material.file,
+                    usd_material.path,
+                )
+            elif texture_path is not None:
+                materials[request] = create_texture_material(
+                    stage,
+                    mat_path,
                     element_name,
-                    face=face,
+                    texture_path,
+                    repeat=not texture_name_requests_stretch(texture_path),
                 )
-                if usd_material is not None:
-                    materials[(element_name, face)] = reference_usd_material(
-                        stage,
-                        mat_path,
-                        usd_material.file,
-                        usd_material.path,
-                    )
-                    continue
+            else:
+                materials[request] = create_preview_material(
+                    stage,
+                    mat_path,
+                    element_name,
+                    color_resolver.resolve(element_name),
+                )
+        return materials
 
-                if texture_path is not None:
-                    materials[(element_name, face)] = create_texture_material(
-                        stage,
-                        mat_path,
-                        element_name,
-                        texture_path,
-                        repeat=not texture_name_requests_stretch(texture_path),
-                    )
-                    continue
 
-            materials[(element_name, face)] = create_preview_material(
-                stage,
-                mat_path,
-                element_name,
-                color_resolver.resolve(element_name),
-            )
-        return materials
+def resolve_material_requests(
+    material_requests: tuple[MaterialRequest, ...],
+    material_source: MaterialSource | None,
+) -> dict[MaterialRequest, MaterialResolution]:
+    """Decide once per request between a referenced USD material, a texture, or neither."""
+    if material_source is None:
+        return {request: (None, None) for request in material_requests}
+    return {
+        (element_name, face): material_source.resolve_for_usd(element_name, face=face)
+        for element_name, face in material_requests
+    }
 
 
 def _material_request_name(element_name: str, face: FaceSide | None) -> str:
@@ -2,51 +2,49 @@
 
 from __future__ import annotations
 
-from pxr import Gf
-
-
-def box_mesh(
-    center: tuple[float, float, float],
-    size: tuple[float, float, float],
-) -> tuple[list, list, list, list]:
-    cx, cy, cz = center
-    hw, hd, hh = size[0] / 2.0, size[1] / 2.0, size[2] / 2.0
-
-    points = [
-        Gf.Vec3f(cx - hw, cy - hd, cz - hh),
-        Gf.Vec3f(cx + hw, cy - hd, cz - hh),
-        Gf.Vec3f(cx + hw, cy + hd, cz - hh),
-        Gf.Vec3f(cx - hw, cy + hd, cz - hh),
-        Gf.Vec3f(cx - hw, cy - hd, cz + hh),
-        Gf.Vec3f(cx + hw, cy - hd, cz + hh),
-        Gf.Vec3f(cx + hw, cy + hd, cz + hh),
-        Gf.Vec3f(cx - hw, cy + hd, cz + hh),
-    ]
-
-    face_vertex_counts = [4, 4, 4, 4, 4, 4]
-    face_vertex_indices = [
-        0, 3, 2, 1,
-        4, 5, 6, 7,
-        0, 1, 5, 4,
-        2, 3, 7, 6,
-        0, 4, 7, 3,
-        1, 2, 6, 5,
-    ]
-
-    uvs = [
-        Gf.Vec2f(0, 0), Gf.Vec2f(1, 0), Gf.Vec2f(1, 1), Gf.Vec2f(0, 1),
-        Gf.Vec2f(0, 0), Gf.Vec2f(1, 0), Gf.Vec2f(1, 1), Gf.Vec2f(0, 1),
-        Gf.Vec2f(0, 0), Gf.Vec2f(1, 0), Gf.Vec2f(1, 1), Gf.Vec2f(0, 1),
-        Gf.Vec2f(0, 0), Gf.Vec2f(1, 0), Gf.Vec2f(1, 1), Gf.Vec2f(0, 1),
-        Gf.Vec2f(0, 0), Gf.Vec2f(1, 0), Gf.Vec2f(1, 1), Gf.Vec2f(0, 1),
-        Gf.Vec2f(0, 0), Gf.Vec2f(1, 0), Gf.Vec2f(1, 1), Gf.Vec2f(0, 1),
-    ]
-
-    return points, face_vertex_counts, face_vertex_indices, uvs
-
-
+from functools import lru_cache
+
+import numpy as np
+
+from ..maze_materials.naming import NON_NAME_CHAR
+
+_BOX_CORNER_SIGNS = np.array(
+    [
+        [-1.0, -1.0, -1.0],
+        [1.0, -1.0, -1.0],
+        [1.0, 1.0, -1.0],
+        [-1.0, 1.0, -1.0],
+        [-1.0, -1.0, 1.0],
+        [1.0, -1.0, 1.0],
+        [1.0, 1.0, 1.0],
+        [-1.0, 1.0, 1.0],
+    ],
+    dtype=np.float64,
+)
+
+BOX_FACE_VERTEX_COUNTS = (4, 4, 4, 4, 4, 4)
+BOX_FACE_VERTEX_INDICES = (
+    0, 3, 2, 1,
+    4, 5, 6, 7,
+    0, 1, 5, 4,
+    2, 3, 7, 6,
+    0, 4, 7, 3,
+    1, 2, 6, 5,
+)
+
+
+def box_mesh_points(centers, sizes) -> np.ndarray:
+    """Return the (N, 8, 3) float32 corners of N axis-aligned boxes."""
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 1, 3)
+    half_sizes = np.asarray(sizes, dtype=np.float64).reshape(-1, 1, 3) / 2.0
+    return (centers + _BOX_CORNER_SIGNS * half_sizes).astype(np.float32)
+
+
+@lru_cache(maxsize=256)
 def sanitize_prim_name(name: str) -> str:
-    clean = "".join(char if char.isalnum() or char == "_" else "_" for char in name.strip())
+    if name.isascii() and name.isidentifier():
+        return name
+    clean = NON_NAME_CHAR.sub("_", name.strip())
     if not clean:
         raise ValueError("Prim name cannot be empty after sanitization")
     if clean[0].isdigit():
@@ -2,39 +2,47 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from dataclasses import dataclass
 
+import numpy as np
 from pxr import Sdf, UsdGeom, UsdPhysics, UsdShade, Vt
 
 from ..maze_boolean.union import (
-    boolean_union_boxes,
+    boolean_union_box_groups,
     convex_segment_boxes,
     mesh_face_sides,
-    trimesh_to_usd_data,
+    trimesh_to_usd_arrays,
+)
+from ..maze_geometry.models import WallArrays, WallBox
+from .mesh_primitives import (
+    BOX_FACE_VERTEX_COUNTS,
+    BOX_FACE_VERTEX_INDICES,
+    box_mesh_points,
+    sanitize_prim_name,
 )
-from ..maze_geometry.models import WallBox
-from .mesh_primitives import box_mesh, sanitize_prim_name
 
 MaterialKey = tuple[str, str | None]
 
 
 @dataclass(frozen=True, slots=True)
 class MergedWallWriter:
+    union_workers: int | None = 1
+    half_precision_uvs: bool = False
+
     def write(
         self,
         stage,
-        walls: tuple[WallBox, ...],
+        walls: WallArrays | tuple[WallBox, ...],
         materials: dict[MaterialKey, object],
         *,
         face_override_elements: set[str] | None = None,
         uv_modes: dict[MaterialKey, str] | None = None,
     ) -> None:
-        if not walls:
+        if not len(walls):
             return
         self._write_boolean_merged(
             stage,
-            walls,
+            _as_wall_arrays(walls),
             materials,
             face_override_elements=face_override_elements or set(),
             uv_modes=uv_modes or {},
@@ -43,73 +51,100 @@ class MergedWallWriter:
     def _write_boolean_merged(
         self,
         stage,
-        walls: tuple[WallBox, ...],
+        arrays: WallArrays,
         materials: dict[MaterialKey, object],
         *,
         face_override_elements: set[str],
         uv_modes: dict[MaterialKey, str],
     ) -> None:
-        grouped: dict[str, list[tuple[tuple[float, float, float], tuple[float, float, float]]]] = defaultdict(list)
-        for wall in walls:
-            grouped[wall.element_name].append((wall.center, wall.size))
+        order = np.argsort(arrays.element_ids, kind="stable")
+        group_ends = np.searchsorted(
+            arrays.element_ids[order],
+            np.arange(1, len(arrays.element_names) + 1),
+        )
+        sorted_centers = arrays.centers[order].tolist()
+        sorted_sizes = arrays.sizes[order].tolist()
 
         mesh = UsdGeom.Mesh.Define(stage, "/Maze/Walls/merged_walls")
         material_binding_api = UsdShade.MaterialBindingAPI.Apply(mesh.GetPrim())
-        all_points = []
-        all_face_counts: list[int] = []
-        all_face_indices: list[int] = []
-        all_uvs = []
+        all_points: list[np.ndarray] = []
+        all_face_counts: list[np.ndarray] = []
+        all_face_indices: list[np.ndarray] = []
+        all_uvs: list[np.ndarray] = []
         vertex_offset = 0
         face_offset = 0
-        material_faces: dict[MaterialKey, list[int]] = defaultdict(list)
-
-        for element_name, box_specs in sorted(grouped.items()):
-            union_mesh = boolean_union_boxes(box_specs)
+        material_faces: dict[MaterialKey, np.ndarray] = {}
+
+        group_starts = [0, *group_ends.tolist()[:-1]]
+        union_meshes = boolean_union_box_groups(
+            (
+                zip(sorted_centers[group_start:group_end], sorted_sizes[group_start:group_end])
+                for group_start, group_end in zip(group_starts, group_ends.tolist())
+            ),
+            max_workers=self.union_workers,
+        )
+        for element_name, union_mesh in zip(arrays.element_names, union_meshes):
             if element_name in face_override_elements:
                 face_sides = mesh_face_sides(union_mesh, collapse_caps=True)
                 face_uv_modes = [
                     uv_modes.get((element_name, face_side), "repeat")
                     for face_side in face_sides
                 ]
-                vertices, face_counts, face_indices, uvs = trimesh_to_usd_data(
+                vertices, face_counts, face_indices, uvs = trimesh_to_usd_arrays(
                     union_mesh,
                     face_uv_modes=face_uv_modes,
                 )
             else:
-                face_sides = [None] * len(union_mesh.faces)
-                vertices, face_counts, face_indices, uvs = trimesh_to_usd_data(
+                face_sides = None
+                vertices, face_counts, face_indices, uvs = trimesh_to_usd_arrays(
                     union_mesh,
                     uv_mode=uv_modes.get((element_name, None), "repeat"),
                 )
 
-            all_points.extend(vertices)
-            all_face_counts.extend(face_counts)
-            all_face_indices.extend(index + vertex_offset for index in face_indices)
-            all_uvs.extend(uvs)
-
-            for local_face_index, face_side in enumerate(face_sides):
-                material_faces[(element_name, face_side)].append(face_offset + local_face_index)
+            all_points.append(vertices)
+            all_face_counts.append(face_counts)
+            all_face_indices.append(face_indices + np.int32(vertex_offset))
+            all_uvs.append(uvs)
+
+            face_count = len(face_counts)
+            if face_sides is None:
+                if face_count:
+                    material_faces[(element_name, None)] = np.arange(
+                        face_offset,
+                        face_offset + face_count,
+                        dtype=np.int32,
+                    )
+            else:
+                side_array = np.asarray(face_sides, dtype=object)
+                for face_side in ("left", "right"):
+                    side_faces = np.flatnonzero(side_array == face_side)
+                    if side_faces.size:
+                        material_faces[(element_name, face_side)] = (side_faces + face_offset).astype(np.int32)
 
             vertex_offset += len(vertices)
-            face_offset += len(face_counts)
+            face_offset += face_count
 
-        mesh.CreatePointsAttr(all_points)
-        mesh.CreateFaceVertexCountsAttr(all_face_counts)
-        mesh.CreateFaceVertexIndicesAttr(all_face_indices)
+        points, face_indices = _weld_points(np.concatenate(all_points), np.concatenate(all_face_indices))
+        mesh.CreatePointsAttr(Vt.Vec3fArray.FromNumpy(points))
+        mesh.CreateFaceVertexCountsAttr(Vt.IntArray.FromNumpy(np.concatenate(all_face_counts)))
+        mesh.CreateFaceVertexIndicesAttr(Vt.IntArray.FromNumpy(face_indices))
         mesh.CreateDoubleSidedAttr(True)
 
-        uv_attr = UsdGeom.PrimvarsAPI(mesh).CreatePrimvar(
-            "st",
-            Sdf.ValueTypeNames.TexCoord2fArray,
-            UsdGeom.Tokens.faceVarying,
-        )
-        uv_attr.Set(all_uvs)
+        uvs = np.concatenate(all_uvs)
+        if self.half_precision_uvs:
+            uv_type = Sdf.ValueTypeNames.TexCoord2hArray
+            uv_values = Vt.Vec2hArray.FromNumpy(uvs.astype(np.float16))
+        else:
+            uv_type = Sdf.ValueTypeNames.TexCoord2fArray
+            uv_values = Vt.Vec2fArray.FromNumpy(uvs)
+        uv_attr = UsdGeom.PrimvarsAPI(mesh).CreatePrimvar("st", uv_type, UsdGeom.Tokens.faceVarying)
+        uv_attr.Set(uv_values)
 
         for material_key, indices in sorted(material_faces.items(), key=_material_key_sort_key):
             element_name, face_side = material_key
             subset = material_binding_api.CreateMaterialBindSubset(
                 f"material_{_material_request_name(element_name, face_side)}",
-                Vt.IntArray(indices),
+                Vt.IntArray.FromNumpy(indices),
             )
             material = materials.get(material_key)
             if material is not None:
@@ -118,17 +153,23 @@ class MergedWallWriter:
 
 @dataclass(frozen=True, slots=True)
 class CompoundBoxColliderWriter:
-    def write(self, stage, walls: tuple[WallBox, ...]) -> None:
-        if not walls:
+    def write(self, stage, walls: WallArrays | tuple[WallBox, ...]) -> None:
+        if not len(walls):
             return
 
         UsdGeom.Xform.Define(stage, "/Maze/Colliders")
-        segments = convex_segment_boxes((wall.center, wall.size) for wall in walls)
+        arrays = _as_wall_arrays(walls)
+        segments = convex_segment_boxes(zip(arrays.centers.tolist(), arrays.sizes.tolist()))
+        segment_points = box_mesh_points(
+            [center for center, _ in segments],
+            [size for _, size in segments],
+        )
+        face_counts = Vt.IntArray(BOX_FACE_VERTEX_COUNTS)
+        face_indices = Vt.IntArray(BOX_FACE_VERTEX_INDICES)
 
-        for index, (center, size) in enumerate(segments):
+        for index, points in enumerate(segment_points):
             mesh = UsdGeom.Mesh.Define(stage, f"/Maze/Colliders/collider_{index:04d}")
-            points, face_counts, face_indices, _ = box_mesh(center, size)
-            mesh.CreatePointsAttr(points)
+            mesh.CreatePointsAttr(Vt.Vec3fArray.FromNumpy(points))
             mesh.CreateFaceVertexCountsAttr(face_counts)
             mesh.CreateFaceVertexIndicesAttr(face_indices)
             mesh.CreateDoubleSidedAttr(False)
@@ -137,7 +178,23 @@ class CompoundBoxColliderWriter:
             UsdPhysics.CollisionAPI.Apply(mesh.GetPrim())
 
 
-def _material_key_sort_key(value: tuple[MaterialKey, list[int]]) -> tuple[str, int]:
+def _weld_points(points: np.ndarray, face_indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Merge bit-identical points, keeping each point at its first occurrence."""
+    _, first_index, inverse = np.unique(points, axis=0, return_index=True, return_inverse=True)
+    order = np.argsort(first_index, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    remap = rank[inverse.reshape(-1)].astype(np.int32)
+    return points[first_index[order]], remap[face_indices]
+
+
+def _as_wall_arrays(walls: WallArrays | tuple[WallBox, ...]) -> WallArrays:
+    if isinstance(walls, WallArrays):
+        return walls
+    return WallArrays.from_walls(walls)
+
+
+def _material_key_sort_key(value: tuple[MaterialKey, np.ndarray]) -> tuple[str, int]:
     (element_name, face_side), _ = value
     face_order = {None: 0, "left": 1, "right": 2}
     return element_name, face_order[face_side]
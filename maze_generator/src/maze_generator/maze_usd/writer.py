@@ -9,7 +9,12 @@ from pxr import Usd, UsdGeom
 from ..maze_geometry.models import MazeGeometry
 from ..maze_materials.color import MaterialMap
 from ..maze_materials.source import FaceSide, MaterialSource, texture_name_requests_stretch
-from .material_library import MaterialLibrary
+from .material_library import (
+    MaterialLibrary,
+    MaterialRequest,
+    MaterialResolution,
+    resolve_material_requests,
+)
 from .wall_writers import (
     CompoundBoxColliderWriter,
     MergedWallWriter,
@@ -22,6 +27,8 @@ def write_usd(
     *,
     material_map: MaterialMap | None = None,
     material_source: MaterialSource | None = None,
+    union_workers: int | None = 1,
+    half_precision_uvs: bool = False,
 ) -> None:
     if not isinstance(geometry, MazeGeometry):
         raise TypeError("geometry must be MazeGeometry")
@@ -42,22 +49,25 @@ def write_usd(
     UsdGeom.Xform.Define(stage, "/Maze/Walls")
     UsdGeom.Xform.Define(stage, "/Maze/Materials")
 
-    material_requests = _material_requests(geometry, material_source)
+    face_override_elements = _face_override_elements(geometry, material_source)
+    material_requests = _material_requests(geometry, face_override_elements)
+    resolved = resolve_material_requests(material_requests, material_source)
     materials = MaterialLibrary(material_map=material_map, material_source=material_source).create(
         stage,
         material_requests,
+        resolved=resolved,
     )
-    face_override_elements = _face_override_elements(geometry, material_source)
-    uv_modes = _material_request_uv_modes(material_requests, material_source)
+    uv_modes = _material_request_uv_modes(material_requests, resolved)
 
-    MergedWallWriter().write(
+    walls = geometry.wall_arrays
+    MergedWallWriter(union_workers=union_workers, half_precision_uvs=half_precision_uvs).write(
         stage,
-        geometry.walls,
+        walls,
         materials,
         face_override_elements=face_override_elements,
         uv_modes=uv_modes,
     )
-    CompoundBoxColliderWriter().write(stage, geometry.walls)
+    CompoundBoxColliderWriter().write(stage, walls)
 
     stage.GetRootLayer().Save()
     if not output.is_file():
@@ -80,11 +90,11 @@ def _face_override_elements(
 
 def _material_requests(
     geometry: MazeGeometry,
-    material_source: MaterialSource | None,
+    face_override_elements: set[str],
 ) -> tuple[tuple[str, FaceSide | None], ...]:
     requests: list[tuple[str, FaceSide | None]] = []
     for element_name in geometry.element_names:
-        if material_source is not None and material_source.has_face_override(element_name):
+        if element_name in face_override_elements:
             requests.append((element_name, "left"))
             requests.append((element_name, "right"))
             continue
@@ -94,15 +104,12 @@ def _material_requests(
 
 def _material_request_uv_modes(
     material_requests: tuple[tuple[str, FaceSide | None], ...],
-    material_source: MaterialSource | None,
+    resolved: dict[MaterialRequest, MaterialResolution],
 ) -> dict[tuple[str, FaceSide | None], str]:
     uv_modes: dict[tuple[str, FaceSide | None], str] = {}
-    for element_name, face in material_requests:
-        if material_source is None:
-            uv_modes[(element_name, face)] = "repeat"
-            continue
-        _, texture_path = material_source.resolve_for_usd(element_name, face=face)
-        uv_modes[(element_name, face)] = (
+    for request in material_requests:
+        _, texture_path = resolved[request]
+        uv_modes[request] = (
             "stretch"
             if texture_path is not None and texture_name_requests_stretch(texture_path)
             else "repeat"
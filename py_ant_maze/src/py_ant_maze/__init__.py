@@ -105,4 +105,4 @@ __all__ = [
     "config_text_to_image",
     "config_file_to_image",
 ]
-__version__ = "0.1.1"
+__version__ = "0.1.2"
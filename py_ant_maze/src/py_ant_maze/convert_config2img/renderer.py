@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Sequence, Tuple
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 from ..maze import Maze, MazeDraft
@@ -67,23 +68,29 @@ class MazeConfigImageRenderer:
         origin_x = frame_padding + grid_padding
         origin_y = frame_padding + grid_padding
 
-        for row_index in range(rows):
-            for col_index in range(cols):
-                value = grid[row_index][col_index]
-                if value in cell_name_by_value:
-                    layer = "cell"
-                    name = cell_name_by_value[value]
-                elif value in wall_name_by_value:
-                    layer = "wall"
-                    name = wall_name_by_value[value]
-                else:
-                    layer = "cell"
-                    name = "unknown"
-
-                color = self.color_resolver.resolve(name, layer=layer)
-                x = origin_x + col_index * (cell_size + gap)
-                y = origin_y + row_index * (cell_size + gap)
-                _draw_rect(draw, x, y, cell_size, cell_size, color)
+        values, value_indices = np.unique(np.asarray(grid, dtype=np.int64), return_inverse=True)
+        palette = np.empty((len(values), 3), dtype=np.uint8)
+        for palette_index, value in enumerate(values.tolist()):
+            if value in cell_name_by_value:
+                layer = "cell"
+                name = cell_name_by_value[value]
+            elif value in wall_name_by_value:
+                layer = "wall"
+                name = wall_name_by_value[value]
+            else:
+                layer = "cell"
+                name = "unknown"
+
+            palette[palette_index] = self.color_resolver.resolve(name, layer=layer)
+        cell_colors = palette[value_indices.reshape(rows, cols)]
+
+        cells_image = _tile_cell_colors(
+            cell_colors,
+            cell_size=cell_size,
+            gap=gap,
+            gap_color=self.palette.occupancy_container,
+        )
+        image.paste(cells_image, (origin_x, origin_y))
 
         return image
 
@@ -254,6 +261,17 @@ def _edge_offset(index: int, cell_size: int, wall_thickness: int) -> int:
     return (index // 2) * (cell_size + wall_thickness) + wall_thickness
 
 
+def _tile_cell_colors(cell_colors: np.ndarray, *, cell_size: int, gap: int, gap_color: RGB) -> Image.Image:
+    rows, cols, _ = cell_colors.shape
+    pitch = cell_size + gap
+    tiles = np.empty((rows, pitch, cols, pitch, 3), dtype=np.uint8)
+    tiles[...] = gap_color
+    tiles[:, :cell_size, :, :cell_size, :] = cell_colors[:, None, :, None, :]
+    pixels = tiles.reshape(rows * pitch, cols * pitch, 3)
+    pixels = pixels[: rows * pitch - gap, : cols * pitch - gap]
+    return Image.fromarray(np.ascontiguousarray(pixels), "RGB")
+
+
 def _draw_rect(draw: ImageDraw.ImageDraw, x: int, y: int, width: int, height: int, color: RGB) -> None:
     if width <= 0 or height <= 0:
         raise ValueError("width and height must be positive")
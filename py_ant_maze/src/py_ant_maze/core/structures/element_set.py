@@ -111,6 +111,8 @@ class ElementSet:
                     raise ValueError(f"duplicate element value: {value}")
                 explicit_values.add(value)
 
+        taken_values = explicit_values.union(reserved_values.values(), blocked_values)
+        next_value = 0
         for item in items:
             name = item.get("name")
             token = item.get("token")
@@ -125,13 +127,8 @@ class ElementSet:
                     if value in explicit_values:
                         raise ValueError(f"reserved value already used: {value}")
                 else:
-                    blocked = (
-                        used_values
-                        .union(explicit_values)
-                        .union(reserved_values.values())
-                        .union(blocked_values)
-                    )
-                    value = _next_available_value(blocked)
+                    next_value = _next_available_value(taken_values, start=next_value)
+                    value = next_value
 
             if value in blocked_values:
                 raise ValueError(f"element value is reserved: {value}")
@@ -140,13 +137,14 @@ class ElementSet:
 
             element = element_cls(name=name, token=token, value=value)
             used_values.add(value)
+            taken_values.add(value)
             parsed.append(element)
 
         return cls(parsed)
 
 
-def _next_available_value(used: ElementValueSet) -> int:
-    candidate = 0
+def _next_available_value(used: ElementValueSet, start: int = 0) -> int:
+    candidate = start
     while candidate in used:
         candidate += 1
     return candidate
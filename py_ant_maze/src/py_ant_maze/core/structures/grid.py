@@ -40,18 +40,15 @@ def parse_grid(layout: LayoutInput, elements: ElementSet) -> Grid:
     if width == 0:
         raise ValueError("layout must have at least one column")
 
+    value_by_token = {el.token: el.value for el in elements.elements()}
     grid: Grid = []
     for row in rows:
         if len(row) != width:
             raise ValueError("all rows must have the same length")
-        grid_row = []
-        for token in row:
-            try:
-                element = elements.element_for_token(token)
-            except KeyError as exc:
-                raise ValueError(f"unknown layout token: {token}") from exc
-            grid_row.append(element.value)
-        grid.append(grid_row)
+        try:
+            grid.append([value_by_token[token] for token in row])
+        except KeyError as exc:
+            raise ValueError(f"unknown layout token: {exc.args[0]}") from exc
 
     return grid
 
@@ -62,16 +59,18 @@ def format_grid(
     with_grid_numbers: bool = False,
 ) -> GridLines:
     token_by_value = {el.value: el.token for el in elements.elements()}
-    rows = [[token_by_value[cell] for cell in row] for row in grid]
-    height = len(rows)
-    width = len(rows[0]) if rows else 0
+    height = len(grid)
+    width = len(grid[0]) if grid else 0
 
     if not with_grid_numbers:
-        return ["".join(row) for row in rows]
+        token_for = token_by_value.__getitem__
+        return ["".join(map(token_for, row)) for row in grid]
 
     index_width = len(str(max(width - 1, height - 1, 0)))
     cell_width = max(1, index_width)
     interval = _LARGE_GRID_INTERVAL if max(width, height) > _LARGE_GRID_THRESHOLD else 1
+    padded_by_value = {value: f"{token:>{cell_width}}" for value, token in token_by_value.items()}
+    padded_for = padded_by_value.__getitem__
 
     header_cells = []
     for col in range(width):
@@ -83,14 +82,13 @@ def format_grid(
     header = header_prefix + " ".join(header_cells)
 
     lines = [header]
-    for row_index, row in enumerate(rows):
+    for row_index, row in enumerate(grid):
         row_label = (
             f"{row_index:>{index_width}}"
             if row_index % interval == 0
             else _GRID_PAD_CHAR * index_width
         )
-        row_cells = [f"{token:>{cell_width}}" for token in row]
-        line = f"{row_label} | " + " ".join(row_cells)
+        line = f"{row_label} | " + " ".join(map(padded_for, row))
         lines.append(line)
     return lines
 
@@ -115,7 +113,7 @@ def _layout_to_lines(layout: LayoutInput) -> GridLines:
 
 
 def _tokens_from_line(line: str) -> TokenRow:
-    condensed = "".join(ch for ch in line if not ch.isspace())
+    condensed = "".join(line.split())
     if not condensed:
         raise ValueError("layout row is empty")
     return list(condensed)
@@ -1,9 +1,10 @@
 """YAML serialization helpers."""
-from .serialization import dump_yaml
+from .serialization import dump_yaml, load_yaml
 from .yaml_types import LiteralStr, QuotedStr, literal_block
 
 __all__ = [
     "dump_yaml",
+    "load_yaml",
     "LiteralStr",
     "QuotedStr",
     "literal_block",
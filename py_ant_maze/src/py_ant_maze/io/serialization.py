@@ -1,11 +1,16 @@
 import copy
-from typing import Any
+from typing import Any, Union
 
 import yaml
 
 from .yaml_types import LiteralStr, QuotedStr
 from ..core.types import Spec
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 class _MazeDumper(yaml.SafeDumper):
     """YAML dumper that renders layout strings using literal blocks."""
@@ -23,6 +28,10 @@ _MazeDumper.add_representer(LiteralStr, _literal_block_representer)
 _MazeDumper.add_representer(QuotedStr, _quoted_str_representer)
 
 
+def load_yaml(text: Union[str, bytes]) -> Any:
+    return yaml.load(text, Loader=_SafeLoader)
+
+
 def dump_yaml(mapping: Spec) -> str:
     data = copy.deepcopy(mapping)
     _wrap_config_tokens(data)
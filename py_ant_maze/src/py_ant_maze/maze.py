@@ -1,15 +1,15 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Optional
 
-import yaml
-
 from .core.parsing.multi_level import LevelIdentifier, resolve_level
 from .core.registry import get_handler
 from .core.types import Grid
 from .core.types import MazeSpec, MazeType
-from .io.serialization import dump_yaml
+from .io.serialization import dump_yaml, load_yaml
 
 
 @dataclass(frozen=True)
@@ -24,7 +24,9 @@ class Maze:
 
     @classmethod
     def from_file(cls, path: str) -> "Maze":
-        return MazeDraft.from_file(path).freeze()
+        real_path = os.path.realpath(path)
+        stat = os.stat(real_path)
+        return _load_maze_file(real_path, stat.st_mtime_ns, stat.st_size)
 
     def to_text(self, with_grid_numbers: bool = False) -> str:
         maze_spec = self.to_spec(with_grid_numbers=with_grid_numbers)
@@ -57,15 +59,15 @@ class MazeDraft:
     layout: Any
 
     @classmethod
-    def from_text(cls, text: str) -> "MazeDraft":
-        data = yaml.safe_load(text)
+    def from_text(cls, text: str | bytes) -> "MazeDraft":
+        data = load_yaml(text)
         if not isinstance(data, dict):
             raise TypeError("maze YAML must be a dict")
         return cls.from_spec(data)
 
     @classmethod
     def from_file(cls, path: str) -> "MazeDraft":
-        with open(path, "r", encoding="utf-8") as handle:
+        with open(path, "rb") as handle:
             return cls.from_text(handle.read())
 
     def to_text(self, with_grid_numbers: bool = False) -> str:
@@ -228,6 +230,11 @@ class MazeDraft:
         return arms[arm]
 
 
+@lru_cache(maxsize=64)
+def _load_maze_file(path: str, mtime_ns: int, size: int) -> Maze:
+    return MazeDraft.from_file(path).freeze()
+
+
 def _set_grid_value(grid: Grid, row: int, col: int, value: int, *, context: str) -> None:
     if not isinstance(row, int) or not isinstance(col, int):
         raise TypeError(f"{context} row/col must be integers")
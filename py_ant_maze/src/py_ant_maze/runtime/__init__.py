@@ -18,6 +18,7 @@ from .spatial import (
     OccupancyGridSpatialRuntime,
     SpatialWallSemantics,
     create_spatial_runtime,
+    value_mask,
 )
 
 __all__ = [
@@ -39,4 +40,5 @@ __all__ = [
     "frame_flips_x",
     "frame_flips_y",
     "normalize_frame",
+    "value_mask",
 ]
@@ -49,14 +49,16 @@ class BaseSpatialRuntime:
 
         self.runtime = runtime
         self.maze_type = runtime.maze_type
+        self._config = runtime.maze.config
+        self._layout = runtime.maze.layout
         self.cell_size = runtime.cell_size
         self.rows = runtime.rows
         self.cols = runtime.cols
         self.width = runtime.width
         self.height = runtime.height
-        self.wall_height = float(runtime.maze.config.wall_height)
+        self.wall_height = float(self._config.wall_height)
         self.wall_thickness = float(
-            getattr(runtime.maze.config, "wall_thickness", runtime.cell_size)
+            getattr(self._config, "wall_thickness", runtime.cell_size)
         )
         self.origin_xy = (
             (-0.5 * self.width, -0.5 * self.height)
@@ -68,12 +70,14 @@ class BaseSpatialRuntime:
             self.origin_xy[1] + 0.5 * self.cell_size,
         )
 
-        self._cells = np.asarray(runtime.cells.values, dtype=np.int64)
+        self._cells = _compact_value_array(runtime.cells.values)
+        self._cells.setflags(write=False)
         self._cell_values_by_name = runtime.semantics.cell_values_by_name
         self._wall_values_by_name = runtime.semantics.wall_values_by_name
         self._cell_values_by_token = runtime.semantics.cell_values_by_token
         self._wall_values_by_token = runtime.semantics.wall_values_by_token
         self._all_wall_values = self._collect_all_wall_values()
+        self._cell_centers_by_values: dict[frozenset[int], np.ndarray] = {}
         self._active_wall_values = self._resolve_wall_values(wall_semantics)
 
         segment_set = self._build_wall_segments_for_values(self._active_wall_values)
@@ -124,30 +128,35 @@ class BaseSpatialRuntime:
             raise ValueError("num_positions must be positive")
 
         indicator_values = self._resolve_cell_indicator_values(valid_indicator)
-        centers = self._collect_cell_centers(indicator_values)
-        if not centers:
+        centers = self._cell_centers(indicator_values)
+        if len(centers) == 0:
             raise ValueError(f"No cells found for indicator {valid_indicator!r}")
 
+        candidates = range(len(centers))
         if num_positions > len(centers):
-            selected = random.choices(centers, k=num_positions)
+            selected = random.choices(candidates, k=num_positions)
         else:
-            selected = random.sample(centers, num_positions)
+            selected = random.sample(candidates, num_positions)
 
         margin = min(0.45 * self.cell_size, 0.5)
         delta = max(0.0, 0.5 * self.cell_size - margin)
-        points: list[list[float]] = []
-        for cx, cy in selected:
-            px = cx + random.uniform(-delta, delta)
-            py = cy + random.uniform(-delta, delta)
-            points.append([px, py, 0.0])
-        return np.asarray(points, dtype=np.float32)
+        draw = random.random
+        jitter = np.fromiter(
+            (draw() for _ in range(2 * num_positions)),
+            dtype=np.float64,
+            count=2 * num_positions,
+        ).reshape(num_positions, 2)
+        points = np.zeros((num_positions, 3), dtype=np.float64)
+        points[:, :2] = centers[selected]
+        points[:, :2] += -delta + 2.0 * delta * jitter
+        return points.astype(np.float32)
 
     def get_indicator_positions(self, valid_indicator: int | str) -> np.ndarray:
         indicator_values = self._resolve_cell_indicator_values(valid_indicator)
-        centers = self._collect_cell_centers(indicator_values)
-        if not centers:
-            return np.empty((0, 3), dtype=np.float32)
-        return np.asarray([[x, y, 0.0] for x, y in centers], dtype=np.float32)
+        centers = self._cell_centers(indicator_values)
+        points = np.zeros((len(centers), 3), dtype=np.float32)
+        points[:, :2] = centers
+        return points
 
     def get_wall_indices_by_indicator(
         self, indicators: int | str | Sequence[int | str]
@@ -162,7 +171,7 @@ class BaseSpatialRuntime:
 
         if self._wall_segment_values.size == 0:
             return []
-        mask = np.isin(self._wall_segment_values, np.fromiter(values, dtype=np.int64))
+        mask = value_mask(self._wall_segment_values, values)
         return np.flatnonzero(mask).astype(int).tolist()
 
     def get_wall_distances(self, robot_positions: np.ndarray) -> np.ndarray:
@@ -274,7 +283,7 @@ class BaseSpatialRuntime:
 
     def _default_wall_values(self) -> frozenset[int]:
         values: set[int] = set()
-        for element in self.runtime.maze.config.wall_elements.elements():
+        for element in self._config.wall_elements.elements():
             name = str(element.name).strip().lower()
             value = int(element.value)
             if name in {"open", "empty"}:
@@ -402,18 +411,19 @@ class BaseSpatialRuntime:
             values.add(value)
         return frozenset(values)
 
-    def _collect_cell_centers(
-        self, indicator_values: frozenset[int]
-    ) -> list[tuple[float, float]]:
-        centers: list[tuple[float, float]] = []
-        for row in range(self.rows):
-            for col in range(self.cols):
-                value = int(self._cells[row][col])
-                if value not in indicator_values:
-                    continue
-                x = self._cell_center_offset_xy[0] + col * self.cell_size
-                y = self._cell_center_offset_xy[1] + row * self.cell_size
-                centers.append((x, y))
+    def _cell_centers(self, indicator_values: frozenset[int]) -> np.ndarray:
+        centers = self._cell_centers_by_values.get(indicator_values)
+        if centers is None:
+            centers = self._collect_cell_centers(indicator_values)
+            self._cell_centers_by_values[indicator_values] = centers
+        return centers
+
+    def _collect_cell_centers(self, indicator_values: frozenset[int]) -> np.ndarray:
+        mask = value_mask(self._cells, indicator_values)
+        rows, cols = np.divmod(np.flatnonzero(mask), self.cols)
+        centers = np.empty((rows.size, 2), dtype=np.float64)
+        centers[:, 0] = self._cell_center_offset_xy[0] + cols * self.cell_size
+        centers[:, 1] = self._cell_center_offset_xy[1] + rows * self.cell_size
         return centers
 
     def _resolve_indicator_values(
@@ -469,8 +479,8 @@ class EdgeGridSpatialRuntime(BaseSpatialRuntime):
     def _build_wall_segments_for_values(
         self, wall_values: frozenset[int]
     ) -> MazeSegmentSet:
-        vertical = np.asarray(self.runtime.maze.layout.vertical_walls, dtype=np.int64)
-        horizontal = np.asarray(self.runtime.maze.layout.horizontal_walls, dtype=np.int64)
+        vertical = np.asarray(self._layout.vertical_walls, dtype=np.int64)
+        horizontal = np.asarray(self._layout.horizontal_walls, dtype=np.int64)
 
         if vertical.shape != (self.rows, self.cols + 1):
             raise ValueError(
@@ -532,45 +542,64 @@ class OccupancyGridSpatialRuntime(BaseSpatialRuntime):
                 f"Invalid occupancy_grid shape: expected {(self.rows, self.cols)}, got {grid.shape}."
             )
 
-        ox, oy = self.origin_xy
-        segments: list[list[float]] = []
-        values: list[int] = []
-
-        for row in range(self.rows):
-            y0 = oy + row * self.cell_size
-            y1 = y0 + self.cell_size
-            for col in range(self.cols):
-                value = int(grid[row, col])
-                if value not in wall_values:
-                    continue
-
-                x0 = ox + col * self.cell_size
-                x1 = x0 + self.cell_size
-
-                if col == 0 or int(grid[row, col - 1]) not in wall_values:
-                    segments.append([x0, y0, x0, y1])
-                    values.append(value)
-                if col == self.cols - 1 or int(grid[row, col + 1]) not in wall_values:
-                    segments.append([x1, y0, x1, y1])
-                    values.append(value)
-                if row == 0 or int(grid[row - 1, col]) not in wall_values:
-                    segments.append([x0, y0, x1, y0])
-                    values.append(value)
-                if row == self.rows - 1 or int(grid[row + 1, col]) not in wall_values:
-                    segments.append([x0, y1, x1, y1])
-                    values.append(value)
-
-        if not segments:
+        is_wall = value_mask(grid, wall_values)
+        padded = np.pad(is_wall, 1, constant_values=False)
+        exposed = np.empty((self.rows, self.cols, 4), dtype=bool)
+        exposed[:, :, 0] = ~padded[1:-1, :-2]
+        exposed[:, :, 1] = ~padded[1:-1, 2:]
+        exposed[:, :, 2] = ~padded[:-2, 1:-1]
+        exposed[:, :, 3] = ~padded[2:, 1:-1]
+        exposed &= is_wall[:, :, None]
+
+        rows, cols, sides = np.nonzero(exposed)
+        if rows.size == 0:
             return MazeSegmentSet(
                 segments=np.empty((0, 4), dtype=np.float32),
                 values=np.empty((0,), dtype=np.int32),
             )
+
+        ox, oy = self.origin_xy
+        x0 = ox + cols * self.cell_size
+        x1 = x0 + self.cell_size
+        y0 = oy + rows * self.cell_size
+        y1 = y0 + self.cell_size
+        segments = np.empty((rows.size, 4), dtype=np.float64)
+        segments[:, 0] = np.where(sides == 1, x1, x0)
+        segments[:, 1] = np.where(sides == 3, y1, y0)
+        segments[:, 2] = np.where(sides == 0, x0, x1)
+        segments[:, 3] = np.where(sides == 2, y0, y1)
         return MazeSegmentSet(
-            segments=np.asarray(segments, dtype=np.float32),
-            values=np.asarray(values, dtype=np.int32),
+            segments=segments.astype(np.float32),
+            values=grid[rows, cols].astype(np.int32),
         )
 
 
+_MAX_VALUE_TABLE_SIZE = 1 << 16
+
+
+def value_mask(array: np.ndarray, values: frozenset[int]) -> np.ndarray:
+    if array.size == 0 or not values:
+        return np.zeros(array.shape, dtype=bool)
+    low = min(int(array.min()), min(values))
+    high = max(int(array.max()), max(values))
+    if high - low >= _MAX_VALUE_TABLE_SIZE:
+        return np.isin(array, np.fromiter(values, dtype=np.int64))
+    if low >= 0 and high < _MAX_VALUE_TABLE_SIZE:
+        table = np.zeros(high + 1, dtype=bool)
+        table[np.fromiter(values, dtype=np.int64)] = True
+        return table[array]
+    table = np.zeros(high - low + 1, dtype=bool)
+    table[np.fromiter(values, dtype=np.int64) - low] = True
+    return table[array.astype(np.int64) - low]
+
+
+def _compact_value_array(values) -> np.ndarray:
+    array = np.array(values, dtype=np.int64)
+    if array.size and int(array.min()) >= 0:
+        array = array.astype(np.min_scalar_type(int(array.max())))
+    return array
+
+
 def create_spatial_runtime(
     runtime: MazeRuntime,
     *,